@@ -1,17 +1,27 @@
 # Read version number from toml
 # Execute compile command
-import toml
-import os
+import subprocess
 
-# pyinstaller --clean -F -w -n notebooklm2ppt_{version} --optimize=2 --collect-all spire.presentation main.py 
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import tomli as tomllib  # same API, for Python 3.10 and below
 
+# pyinstaller --clean -F -w -n notebooklm2ppt_{version} --optimize=2 --collect-all spire.presentation main.py
 
-with open("pyproject.toml", "r", encoding="utf-8") as f:
-    pyproject_data = toml.load(f)
+
+# tomllib only parses binary file objects
+with open("pyproject.toml", "rb") as f:
+    pyproject_data = tomllib.load(f)
 
 
 version = pyproject_data["project"]["version"]
 output_name = f"notebooklm2ppt-{version}"
 print(f"Compiling version: {output_name}")
 
-os.system(f'pyinstaller --clean -F -w -n {output_name} --optimize=2 --collect-all spire.presentation main.py ')
\ No newline at end of file
+# argv list, no shell: the version string is passed through verbatim and a
+# failed build raises CalledProcessError instead of being ignored
+subprocess.run(
+    ["pyinstaller", "--clean", "-F", "-w", "-n", output_name, "--optimize=2", "--collect-all", "spire.presentation", "main.py"],
+    check=True,
+)
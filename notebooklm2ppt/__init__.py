@@ -3,11 +3,26 @@
 __version__ = "0.4.0"
 __author__ = "Elliott Zheng"
 
-# Core classes
-from .ocr_converter import SlideReconstructor
-from .ppt_generator import PPTCreator, PowerPointGenerator
 from .config import get_api_key, is_gemini_available
 
+# Core classes are imported on first access (PEP 562) so the CLI does not
+# pay for OCR/OpenCV/python-pptx startup unless a mode actually needs them
+_LAZY_IMPORTS = {
+    "SlideReconstructor": ".ocr_converter",
+    "PPTCreator": ".ppt_generator",
+    "PowerPointGenerator": ".ppt_generator",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Expose main functionality
 __all__ = [
     "SlideReconstructor",
@@ -1,17 +1,82 @@
 """CLI: Convert PDF to editable PowerPoint presentations"""
 
 import os
+import queue
 import time
 import threading
-import cv2
 import shutil
 import argparse
 import sys
 from pathlib import Path
-from .pdf2png import pdf_to_png
-from .utils.image_viewer import show_image_fullscreen
-from .utils.screenshot_automation import take_fullscreen_snip, mouse, screen_height, screen_width
-from .ppt_combiner import combine_ppt
+from .config import MAX_CONCURRENT_PAGES
+from .pipeline import extract_pages, open_result_async, render_pages
+
+
+# HighGUI poll interval for the fullscreen viewer; only needs to keep the window responsive
+WAITKEY_MS = 250
+
+
+def _find_latest_pptx(folder):
+    """Return the most recently modified .pptx in folder, or None if there is none"""
+    latest, latest_mtime = None, None
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if not entry.name.endswith(".pptx"):
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest, latest_mtime = entry.path, mtime
+    except FileNotFoundError:
+        return None
+    return Path(latest) if latest else None
+
+
+def _start_downloads_watcher(folder, events):
+    """
+    Watch folder once for new .pptx files and put their paths on events.
+    
+    Returns the running observer, or None when watchdog is unavailable or
+    the folder does not exist.
+    """
+    if not os.path.isdir(folder):
+        return None
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        print("watchdog module not installed (pip install \"notebooklm2ppt[watch]\"), falling back to scanning the Downloads folder.")
+        return None
+
+    class _PptxHandler(FileSystemEventHandler):
+        def on_created(self, event):
+            if not event.is_directory and event.src_path.endswith(".pptx"):
+                events.put(Path(event.src_path))
+
+        def on_moved(self, event):
+            # Downloads are often written to a temp name and renamed at the end
+            if not event.is_directory and event.dest_path.endswith(".pptx"):
+                events.put(Path(event.dest_path))
+
+    observer = Observer()
+    observer.schedule(_PptxHandler(), str(folder), recursive=False)
+    observer.start()
+    return observer
+
+
+def _latest_downloaded_pptx(events, folder):
+    """Newest .pptx reported by the watcher that still exists, or a folder scan without one"""
+    if events is None:
+        return _find_latest_pptx(folder)
+    latest = None
+    while True:
+        try:
+            path = events.get_nowait()
+        except queue.Empty:
+            return latest
+        # Files already moved for earlier pages are still queued; skip them
+        if path.exists():
+            latest = path
 
 
 def process_pdf_to_ppt(pdf_path, png_dir, ppt_dir, delay_between_images=2, inpaint=True, dpi=150, timeout=50, display_height=None, display_width=None, pc_manager_version=None, done_button_offset=None):
@@ -20,8 +85,8 @@ def process_pdf_to_ppt(pdf_path, png_dir, ppt_dir, delay_between_images=2, inpai
     
     Args:
         pdf_path: Path to the PDF file
-        png_dir: Output directory for PNG images
-        ppt_dir: Output directory for PPT files
+        png_dir: Output directory for PNG images (must already exist)
+        ppt_dir: Output directory for PPT files (must already exist)
         delay_between_images: Delay between processing each image (seconds), default 2
         inpaint: Enable image inpainting (watermark removal), default True
         dpi: PNG output resolution, default 150
@@ -31,6 +96,12 @@ def process_pdf_to_ppt(pdf_path, png_dir, ppt_dir, delay_between_images=2, inpai
         pc_manager_version: PC Manager version; 3.19+ uses 190, below 3.19 uses 210
         done_button_offset: Done button right offset; takes priority if specified
     """
+    # Screenshot-only dependencies: OpenCV HighGUI and the Windows automation stack
+    import cv2
+    import fitz  # PyMuPDF
+    from .utils.image_viewer import show_image_fullscreen
+    from .utils.screenshot_automation import take_fullscreen_snip, mouse, screen_height, screen_width
+    
     # 1. Convert PDF to PNG images
     print("=" * 60)
     print("Step 1: Converting PDF to PNG images")
@@ -40,25 +111,32 @@ def process_pdf_to_ppt(pdf_path, png_dir, ppt_dir, delay_between_images=2, inpai
         print(f"Error: PDF file {pdf_path} does not exist")
         return
     
-    pdf_to_png(pdf_path, png_dir, dpi=dpi, inpaint=inpaint)
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+    
+    if not page_count:
+        print(f"Error: PDF file {pdf_path} has no pages")
+        return
+    
+    # Render on a background thread; the screenshot loop below starts on page 1
+    # while later pages are still being rendered/inpainted
+    pages = queue.Queue()
+    render_thread = threading.Thread(
+        target=render_pages,
+        args=(pdf_path, png_dir, dpi, inpaint, pages),
+        name="pdf_render",
+        daemon=True
+    )
+    render_thread.start()
     
-    # Create PPT output directory
-    ppt_dir.mkdir(exist_ok=True, parents=True)
     print(f"PPT output directory: {ppt_dir}")
     
     # Get user's Downloads folder path
     downloads_folder = Path.home() / "Downloads"
     print(f"Downloads folder: {downloads_folder}")
     
-    # 2. Get all PNG image files and sort them
-    png_files = sorted(png_dir.glob("page_*.png"))
-    
-    if not png_files:
-        print(f"Error: No PNG images found in {png_dir}")
-        return
-    
     print("\n" + "=" * 60)
-    print(f"Step 2: Processing {len(png_files)} PNG images")
+    print(f"Step 2: Processing {page_count} PNG images")
     print("=" * 60)
     
     # Set display window size (use screen size if not specified)
@@ -69,19 +147,42 @@ def process_pdf_to_ppt(pdf_path, png_dir, ppt_dir, delay_between_images=2, inpai
     
     print(f"Display window size: {display_width} x {display_height}")
 
+    # Close button of the Smart Selection toolbar. The +35 is deliberate: like the
+    # Done button in take_fullscreen_snip, the toolbar sits just below the
+    # selected region, not inside it.
+    close_button = (int(display_width - 35), int(display_height + 35))
+
+    # Watch Downloads once for the whole run instead of rescanning it per page
+    downloads_events = queue.Queue()
+    downloads_observer = _start_downloads_watcher(downloads_folder, downloads_events)
+    if downloads_observer is None:
+        downloads_events = None
     
-    # 3. Process each image with screenshot capture
-    for idx, png_file in enumerate(png_files, 1):
-        print(f"\n[{idx}/{len(png_files)}] Processing image: {png_file.name}")
+    # 3. Process each image with screenshot capture, as the renderer produces it
+    idx = 0
+    render_error = None
+    for idx, png_file in enumerate(iter(pages.get, None), 1):
+        if isinstance(png_file, Exception):
+            # The remaining pages were never rendered
+            render_error = png_file
+            break
+        print(f"\n[{idx}/{page_count}] Processing image: {png_file.name}")
         
         stop_event = threading.Event()
+        ready_event = threading.Event()
         
         def _viewer():
             """Display image in thread"""
-            show_image_fullscreen(str(png_file), display_height=display_height)
+            win_name = show_image_fullscreen(str(png_file), display_height=display_height)
+            # Let the first frame paint before signalling the window is up
+            cv2.waitKey(1)
+            ready_event.set()
             # Maintain OpenCV event loop
             while not stop_event.is_set():
-                cv2.waitKey(50)
+                cv2.waitKey(WAITKEY_MS)
+                # Stop polling once the window has been closed externally
+                if cv2.getWindowProperty(win_name, cv2.WND_PROP_VISIBLE) < 1:
+                    break
             # Close window
             try:
                 cv2.destroyAllWindows()
@@ -96,8 +197,8 @@ def process_pdf_to_ppt(pdf_path, png_dir, ppt_dir, delay_between_images=2, inpai
         )
         viewer_thread.start()
         
-        # Wait for window to stabilize
-        time.sleep(3)
+        # Wait for window to be shown (falls back to the old 3 s settle time)
+        ready_event.wait(timeout=3.0)
         
         try:
             # Take fullscreen screenshot and detect PPT window
@@ -124,34 +225,30 @@ def process_pdf_to_ppt(pdf_path, png_dir, ppt_dir, delay_between_images=2, inpai
                     search_filename = base_filename
                 
                 ppt_source_path = downloads_folder / search_filename
+                target_path = ppt_dir / f"{png_file.stem}.pptx"
                 
-                if not ppt_source_path.exists():
-                    print(f"  Not found: {ppt_source_path}, searching for recent .pptx files...")
-                    pptx_files = list(downloads_folder.glob("*.pptx"))
-                    if pptx_files:
-                        pptx_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-                        ppt_source_path = pptx_files[0]
-                        print(f"  Found recent PPT file: {ppt_source_path.name}")
-                
-                if ppt_source_path.exists():
-                    target_filename = png_file.stem + ".pptx"
-                    target_path = ppt_dir / target_filename
-                    
-                    shutil.copy2(ppt_source_path, target_path)
-                    print(f"  OK - PPT file copied: {target_path}")
-                    
+                # shutil.move is a single rename on the same volume; a missing
+                # file surfaces as FileNotFoundError instead of a separate exists() check
+                try:
                     try:
-                        ppt_source_path.unlink()
-                        print(f"  OK - Deleted source file: {ppt_source_path}")
-                    except Exception as e:
-                        print(f"  WARNING - Failed to delete source file: {e}")
-                else:
+                        shutil.move(str(ppt_source_path), str(target_path))
+                    except FileNotFoundError:
+                        print(f"  Not found: {ppt_source_path}, checking newly downloaded .pptx files...")
+                        ppt_source_path = _latest_downloaded_pptx(downloads_events, downloads_folder)
+                        if ppt_source_path is None:
+                            raise
+                        print(f"  Found recent PPT file: {ppt_source_path.name}")
+                        shutil.move(str(ppt_source_path), str(target_path))
+                    print(f"  OK - PPT file moved: {ppt_source_path} -> {target_path}")
+                except FileNotFoundError:
                     print(f"  WARNING - PPT file not found in Downloads folder")
+                except OSError as e:
+                    # e.g. PowerPoint still holds the source open, so it could only be copied
+                    print(f"  WARNING - Failed to move source file: {e}")
             elif success:
                 print(f"OK - Image {png_file.name} processed, but PPT filename not retrieved")
             else:
                 print(f"WARNING - Image {png_file.name} captured, but no new PPT window detected")
-                close_button = (display_width - 35, display_height + 35)
                 mouse.click(button='left', coords=close_button)
         except Exception as e:
             print(f"ERROR - Failed to process image {png_file.name}: {e}")
@@ -159,12 +256,19 @@ def process_pdf_to_ppt(pdf_path, png_dir, ppt_dir, delay_between_images=2, inpai
             stop_event.set()
             viewer_thread.join(timeout=2)
         
-        if idx < len(png_files):
+        if idx < page_count:
             print(f"Waiting {delay_between_images} seconds before processing next image...")
             time.sleep(delay_between_images)
     
+    if downloads_observer is not None:
+        downloads_observer.stop()
+        downloads_observer.join()
+    
+    if render_error is not None:
+        raise RuntimeError(f"Failed to render PDF pages: {render_error}") from render_error
+    
     print("\n" + "=" * 60)
-    print(f"Done! Processed {len(png_files)} images")
+    print(f"Done! Processed {idx} images")
     print("=" * 60)
 
 
@@ -269,6 +373,12 @@ Examples:
         help='Use OCR mode: Reconstructs slides by lifting text into editable boxes and cleaning the background (Best for flattened PDFs)'
     )
     
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='OCR mode: also write the rendered page PNGs and annotated debug JPGs to the workspace for inspection'
+    )
+    
     parser.add_argument(
         '--api-key',
         dest='api_key',
@@ -288,7 +398,11 @@ Examples:
     png_dir = workspace_dir / f"{pdf_name}_pngs"
     ppt_dir = workspace_dir / f"{pdf_name}_ppt"
     out_ppt_file = workspace_dir / f"{pdf_name}.pptx"
-    workspace_dir.mkdir(exist_ok=True, parents=True)
+    
+    # Create every output directory up front; nothing below creates them again
+    os.makedirs(png_dir, exist_ok=True)
+    if not args.ocr:
+        os.makedirs(ppt_dir, exist_ok=True)
 
     if args.ocr:
         # OCR Mode
@@ -298,13 +412,17 @@ Examples:
         print(f"PDF File: {pdf_file}")
         print(f"Output: {out_ppt_file}")
         
-        # 1. Convert PDF to PNGs
-        print(f"Converting PDF to PNGs (Restoring 'Golden' Standard Res)...")
-        pdf_to_png(pdf_file, png_dir, dpi=args.dpi, inpaint=False)
+        import fitz  # PyMuPDF
+        
+        # 1. Pages are rendered in memory by the workers; page PNGs are only
+        # written to disk for inspection with --debug
+        if args.debug:
+            from .pdf2png import pdf_to_png
+            print(f"Converting PDF to PNGs (Restoring 'Golden' Standard Res)...")
+            pdf_to_png(pdf_file, png_dir, dpi=args.dpi, inpaint=False)
         
         # 2. Process with OCR and Reconstruct
         # 2. Process with Direct PDF Extraction (PyMuPDF)
-        from .direct_extractor import DirectSlideExtractor
         from .ppt_generator import PPTCreator
         
         print(f"Using Direct PDF Extraction (PyMuPDF)")
@@ -312,42 +430,31 @@ Examples:
         print(f"   - Filters hidden/duplicate OCR text layers")
         print(f"   - Uses precise coordinate mapping")
         
-        extractor = DirectSlideExtractor()
         ppt_creator = PPTCreator()
         
-        import re
-        all_pngs = sorted(png_dir.glob("page_*.png"))
-        png_files = [p for p in all_pngs if re.match(r"page_\d{4}\.png", p.name)]
+        with fitz.open(pdf_file) as doc:
+            page_count = doc.page_count
         
-        print(f"\nProcessing {len(png_files)} pages...")
+        print(f"\nProcessing {page_count} pages ({MAX_CONCURRENT_PAGES} workers)...")
         
-        for idx, png_file in enumerate(png_files):
-            print(f"[{idx+1}/{len(png_files)}] Processing {png_file.name}...")
+        results = extract_pages(pdf_file, page_count, args.dpi, png_dir, args.debug)
+        
+        for idx in sorted(results):
+            slide_data, clean_bg_path, write_future = results[idx]
             
             try:
-                # Direct Extraction (uses PDF for text, Image for bg)
-                slide_data = extractor.process_page(
-                    pdf_path=pdf_file, # Needs PDF path now!
-                    image_path=str(png_file), 
-                    output_dir=png_dir,
-                    page_num=idx
-                )
-                
-                # Save clean background for PPT
-                clean_bg_path = png_dir / f"{png_file.stem}_clean.jpg"
-                cv2.imwrite(str(clean_bg_path), slide_data["clean_image"])
+                # python-pptx reads the background from disk, so this page's write must be done
+                write_future.result()
                 
                 # Add to PPT
-                img_h, img_w = slide_data["clean_image"].shape[:2]
                 ppt_creator.add_slide(
                     str(clean_bg_path), 
                     slide_data["text_blocks"], 
                     slide_data["image_objects"],
-                    (img_w, img_h)
+                    slide_data["image_size"]
                 )
-                
             except Exception as e:
-                print(f"Error processing page {idx}: {e}")
+                print(f"Error adding page {idx}: {e}")
                 import traceback
                 traceback.print_exc()
         
@@ -357,11 +464,14 @@ Examples:
         print(f"Done! PPT saved to: {out_ppt_file}")
         print("=" * 60)
         
-        out_ppt_file = os.path.abspath(out_ppt_file)
-        os.startfile(out_ppt_file)
+        open_result_async(out_ppt_file)
         return
 
     # Default Logic (Screenshot based)
+    from .ppt_combiner import combine_ppt
+    from .utils.screenshot_automation import screen_size
+    
+    screen_width, screen_height = screen_size()
     ratio = min(screen_width/16, screen_height/9)
     max_display_width = int(16 * ratio)
     max_display_height = int(9 * ratio)
@@ -400,7 +510,7 @@ Examples:
 
     combine_ppt(ppt_dir, out_ppt_file)
     out_ppt_file = os.path.abspath(out_ppt_file)
-    os.startfile(out_ppt_file)
+    open_result_async(out_ppt_file)
     print(f"\nFinal merged PPT file: {out_ppt_file}")
 
 
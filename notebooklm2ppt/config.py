@@ -40,6 +40,17 @@ DPI_FOR_EXPORT = 150      # Background image quality (default)
 JPEG_QUALITY = 95
 PNG_COMPRESSION = 6
 
+# Clean background: above this fraction of masked pixels, fill from the
+# unmasked background (its median colour, or an inpaint downscaled by
+# INPAINT_FAST_FILL_SCALE) instead of full-size Navier-Stokes inpainting,
+# whose cost grows with the mask
+INPAINT_FAST_FILL_COVERAGE = 0.15
+INPAINT_FAST_FILL_SCALE = 4
+
+# Pages with no text and less than this fraction of non-white pixels skip the
+# diagram search and the inpainting entirely
+BLANK_PAGE_INK_RATIO = 0.001
+
 # Slide dimensions (16:9 format)
 SLIDE_WIDTH_INCHES = 16
 SLIDE_HEIGHT_INCHES = 9
@@ -1,8 +1,29 @@
 import fitz  # PyMuPDF
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.util import Finalize
 from pathlib import Path
 from typing import Dict, List, Tuple
+from .config import BLANK_PAGE_INK_RATIO
+from .pdf2png import render_page
+from .utils.masks import fill_background, fill_rects, grow_rects
+
+# A k x k rectangular dilation run twice equals one (2k-1) x (2k-1) dilation,
+# and that splits into a horizontal and a vertical 1-D pass
+_DILATE_DIAGRAM = (cv2.getStructuringElement(cv2.MORPH_RECT, (9, 1)),
+                   cv2.getStructuringElement(cv2.MORPH_RECT, (1, 9)))    # 5x5, iterations=2
+# The background mask is only filled boxes, which a 13x13 dilation (7x7,
+# iterations=2) grows by 6 pixels a side; see grow_rects
+_GROW_BACKGROUND = 6
+
+
+def _dilate_separable(mask: np.ndarray, kernels, dst: np.ndarray = None, tmp: np.ndarray = None) -> np.ndarray:
+    """Dilate with a rectangular element given as its (row, column) 1-D factors"""
+    row_kernel, col_kernel = kernels
+    tmp = cv2.dilate(mask, row_kernel, dst=tmp)
+    return cv2.dilate(tmp, col_kernel, dst=dst)
+
 
 class DirectSlideExtractor:
     """
@@ -11,9 +32,56 @@ class DirectSlideExtractor:
     """
     
     def __init__(self):
-        pass
+        # Documents opened by process_page, keyed by path and reused across
+        # pages so the PDF structure is parsed once; released by close()
+        self._doc_cache: Dict[str, fitz.Document] = {}
+        # Page-sized uint8 scratch masks reused across process_page calls, so
+        # one instance must not run process_page from several threads at once
+        self._buffers: Dict[str, np.ndarray] = {}
+        # Crop PNG writes run on a small thread pool (imwrite releases the GIL
+        # while encoding) so they overlap the rest of the page; see flush()
+        self._io_pool: ThreadPoolExecutor = None
+        self._pending_writes = []
+
+    def get_doc(self, pdf_path: str) -> fitz.Document:
+        """Return the cached document for pdf_path, opening it on first use"""
+        key = str(pdf_path)
+        doc = self._doc_cache.get(key)
+        if doc is None:
+            doc = self._doc_cache[key] = fitz.open(key)
+        return doc
+
+    def _buffer(self, name: str, shape) -> np.ndarray:
+        """Reusable uint8 scratch array; reallocated only when the page size changes"""
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape:
+            buf = self._buffers[name] = np.empty(shape, dtype=np.uint8)
+        return buf
 
-    def process_page(self, pdf_path: str, page_num: int, image_path: str, output_dir=None) -> Dict:
+    def _write_image(self, path: str, image: np.ndarray):
+        """Queue a cv2.imwrite on the I/O pool"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=4)
+        self._pending_writes.append((path, self._io_pool.submit(cv2.imwrite, path, image)))
+
+    def flush(self):
+        """Wait until every crop queued by process_page is on disk"""
+        pending, self._pending_writes = self._pending_writes, []
+        for path, future in pending:
+            if not future.result():
+                print(f"Warning: could not write image crop {path}")
+
+    def close(self):
+        """Finish pending writes and close every cached document"""
+        self.flush()
+        if self._io_pool is not None:
+            self._io_pool.shutdown()
+            self._io_pool = None
+        for doc in self._doc_cache.values():
+            doc.close()
+        self._doc_cache.clear()
+
+    def process_page(self, pdf_path: str, page_num: int, image_path: str = None, output_dir=None, image: np.ndarray = None, dpi: int = 150, debug: bool = False) -> Dict:
         """
         Process a specific page of the PDF to extract text and objects.
         
@@ -21,23 +89,34 @@ class DirectSlideExtractor:
             pdf_path: Path to source PDF
             page_num: Page number (0-indexed)
             image_path: Path to the rendered PNG of this page (for dimensions/diagrams)
-            output_dir: Debug output directory
+            output_dir: Output directory for crops (must already exist)
+            image: Already rendered BGR page; used instead of reading image_path
+            dpi: Render resolution when neither image nor image_path is given
+            debug: Also write an annotated {stem}_debug_direct.jpg to output_dir
             
         Returns:
             Dict matching SlideReconstructor format:
             {
                 "text_blocks": [...],
                 "image_objects": [...],
-                "clean_image": ...
+                "clean_image": ...,
+                "image_size": (width, height)
             }
         """
-        doc = fitz.open(pdf_path)
-        page = doc[page_num]
+        page = self.get_doc(pdf_path)[page_num]
         
-        # Load the rendered image to match dimensions
-        img = cv2.imread(str(image_path))
-        if img is None:
-            raise ValueError(f"Could not read image: {image_path}")
+        # Load the rendered image to match dimensions; without one, render the
+        # page in memory (no PNG encode/decode)
+        if image is not None:
+            img = image
+        elif image_path is not None:
+            img = cv2.imread(str(image_path))
+            if img is None:
+                raise ValueError(f"Could not read image: {image_path}")
+        else:
+            img = render_page(page, dpi=dpi)
+        # Output names follow the page_NNNN.png naming used by pdf_to_png
+        stem = Path(image_path).stem if image_path else f"page_{page_num + 1:04d}"
             
         img_h, img_w = img.shape[:2]
         
@@ -52,79 +131,88 @@ class DirectSlideExtractor:
         # 1. Extract Text with sophisticated filtering
         text_blocks = []
         # "dict" format gives detailed text positioning: block -> line -> span
-        text_data = page.get_text("dict", flags=fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE)
+        # One pass over the content stream: TEXT_PRESERVE_IMAGES is left out so
+        # image blocks are not decoded, and glyphs outside the page are clipped
+        text_data = page.get_text(
+            "dict",
+            flags=fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP,
+            sort=False,
+        )
+        
+        mask_text = self._buffer("text", (img_h, img_w))
+        mask_text.fill(0)
+        text_rects = []
+        
+        # Kept boxes as [x0, y0, x1, y1] rows to check for duplicates in one
+        # vectorized pass; capacity doubles when full
+        seen_arr = np.empty((64, 4), dtype=np.int64)
+        n_seen = 0
+        
+        # Candidate spans, flattened in one pass: the cheap size check first
+        # (tiny text is often OCR artifacts), then drop whitespace-only spans.
+        candidates = [
+            (text, span)
+            for block in text_data.get("blocks", []) if block["type"] == 0  # Text
+            for line in block["lines"]
+            for span in line["spans"]
+            if span["size"] >= 4 and (text := span["text"].strip())
+        ]
         
-        mask_text = np.zeros((img_h, img_w), dtype=np.uint8)
+        # Invisible spans (render mode 3, e.g. an OCR layer over a scan) come
+        # with alpha 0. They are kept, since on a scanned page they are the only
+        # text, but moved after the visible spans (stable sort) so that where
+        # both exist the duplicate check below drops the hidden copy and keeps
+        # the visible font, size and colour.
+        if any(span.get("alpha", 255) == 0 for _, span in candidates):
+            candidates.sort(key=lambda c: c[1].get("alpha", 255) == 0)
         
-        seen_boxes = [] # To check for duplicates
+        # Convert every PDF BBox (x0, y0, x1, y1) to Image Pixels in one step
+        # (same float multiply and truncation as int(b * scale) per value)
+        if candidates:
+            bboxes = np.array([span["bbox"] for _, span in candidates], dtype=np.float64)
+            pixel_boxes = (bboxes * (scale_x, scale_y, scale_x, scale_y)).astype(np.int64).tolist()
+        else:
+            pixel_boxes = []
         
-        for block in text_data.get("blocks", []):
-            if block["type"] == 0: # Text
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"].strip()
-                        if not text:
-                            continue
-                        
-                        # Filter tiny text (often OCR artifacts)
-                        if span["size"] < 4:
-                            continue
-                            
-                        # Filter invisible text (white on white or transparent)
-                        # PyMuPDF color is sRGB int or list? usually int or tuple.
-                        # We assume if alpha is present and 0, or color is white...
-                        # Actually standard check is render mode (invisible). fitz doesn't expose render mode easily in dict.
-                        # But we can check overlap.
-                        
-                        # PDF BBox (x0, y0, x1, y1)
-                        bx0, by0, bx1, by1 = span["bbox"]
-                        
-                        # Convert to Image Pixels
-                        px0, py0 = int(bx0 * scale_x), int(by0 * scale_y)
-                        px1, py1 = int(bx1 * scale_x), int(by1 * scale_y)
-                        
-                        w = px1 - px0
-                        h = py1 - py0
-                        
-                        current_box = [px0, py0, w, h]
-                        
-                        # DUPLICATE CHECK: 
-                        # If this box significantly overlaps with a seen box AND text is similar-ish
-                        # "hidden text layer" usually sits exactly on top of visible text.
-                        is_duplicate = False
-                        for seen_b in seen_boxes:
-                            sx, sy, sw, sh = seen_b
-                            # Intersection
-                            ix = max(px0, sx)
-                            iy = max(py0, sy)
-                            iw = min(px0+w, sx+sw) - ix
-                            ih = min(py0+h, sy+sh) - iy
-                            
-                            if iw > 0 and ih > 0:
-                                inter_area = iw * ih
-                                self_area = w * h
-                                # If 80% overlap
-                                if inter_area / self_area > 0.8:
-                                    is_duplicate = True
-                                    break
-                        
-                        if is_duplicate:
-                            continue
-                            
-                        seen_boxes.append(current_box)
-                        
-                        text_blocks.append({
-                            "text": text,
-                            "box": [px0, py0, w, h],
-                            "font_size": span["size"] * scale_y, # Use scaled font size
-                            "font": span["font"],
-                            "color": span["color"]
-                        })
-                        
-                        # Add to text mask (slightly dilated)
-                        pad = 5 # Moderate padding
-                        cv2.rectangle(mask_text, (max(0, px0-pad), max(0, py0-pad)), 
-                                      (min(img_w, px1+pad), min(img_h, py1+pad)), 255, -1)
+        # One font scale for both axes, so sizes do not skew with x/y rounding
+        font_scale = 0.5 * (scale_x + scale_y)
+        
+        for (text, span), (px0, py0, px1, py1) in zip(candidates, pixel_boxes):
+            w = px1 - px0
+            h = py1 - py0
+            
+            # DUPLICATE CHECK: 
+            # If this box significantly overlaps with a seen box AND text is similar-ish
+            # "hidden text layer" usually sits exactly on top of visible text.
+            self_area = w * h
+            if n_seen and self_area > 0:
+                seen = seen_arr[:n_seen]
+                # Intersection with every kept box at once
+                iw = np.minimum(seen[:, 2], px1) - np.maximum(seen[:, 0], px0)
+                ih = np.minimum(seen[:, 3], py1) - np.maximum(seen[:, 1], py0)
+                inter_area = np.clip(iw, 0, None) * np.clip(ih, 0, None)
+                # If 80% overlap
+                if (inter_area / self_area > 0.8).any():
+                    continue
+            
+            if n_seen == len(seen_arr):
+                seen_arr = np.concatenate([seen_arr, np.empty_like(seen_arr)])
+            seen_arr[n_seen] = (px0, py0, px1, py1)
+            n_seen += 1
+            
+            text_blocks.append({
+                "text": text,
+                "box": [px0, py0, w, h],
+                "font_size": span["size"] * font_scale, # Use scaled font size
+                "font": span["font"],
+                "color": span["color"]
+            })
+            
+            # Add to text mask (slightly dilated)
+            pad = 5 # Moderate padding
+            text_rects.append((px0-pad, py0-pad, px1+pad, py1+pad))
+
+        fill_rects(mask_text, text_rects)
 
         # Group text blocks into paragraphs
         grouped_blocks = self._group_text_spans(text_blocks)
@@ -134,71 +222,120 @@ class DirectSlideExtractor:
         # So we look at the original image, masked where the digital text is.
         # What remains are: backgrounds, non-text graphics, embedded images.
         
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        _, binary = cv2.threshold(gray, 240, 255, cv2.THRESH_BINARY_INV)
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=self._buffer("gray", (img_h, img_w)))
+        _, binary = cv2.threshold(gray, 240, 255, cv2.THRESH_BINARY_INV, dst=self._buffer("binary", (img_h, img_w)))
         
-        # Remove known text areas from the binary map
-        binary_no_text = cv2.bitwise_and(binary, binary, mask=cv2.bitwise_not(mask_text))
+        if not text_blocks and cv2.countNonZero(binary) < BLANK_PAGE_INK_RATIO * binary.size:
+            # Nearly blank page without text: no diagram to find, skip the search
+            boxes = np.empty((0, 4), dtype=np.int64)
+        else:
+            # Remove known text areas from the binary map. Both masks are 0/255,
+            # so a saturating subtract is binary AND NOT text in one pass, with
+            # no inverted copy of the mask. The raw binary map is not needed
+            # afterwards, so it is done in place.
+            binary_no_text = cv2.subtract(binary, mask_text, dst=binary)
+            
+            # Dilate to connect diagram parts
+            dilated_img_map = _dilate_separable(
+                binary_no_text, _DILATE_DIAGRAM,
+                dst=self._buffer("dilated", (img_h, img_w)),
+                tmp=self._buffer("dilate_tmp", (img_h, img_w))
+            )
+            
+            # Bounding boxes of the blobs in one connected-components pass, run only
+            # inside the bounding box of the remaining ink
+            roi_x, roi_y, roi_w, roi_h = cv2.boundingRect(dilated_img_map)
+            if roi_w and roi_h:
+                _, _, stats, _ = cv2.connectedComponentsWithStats(
+                    dilated_img_map[roi_y:roi_y+roi_h, roi_x:roi_x+roi_w], connectivity=8
+                )
+                # Drop the background label and reverse, so blobs come bottom-up in
+                # the order findContours used to return them (ids and z-order)
+                boxes = stats[:0:-1, :4].astype(np.int64)
+                boxes[:, 0] += roi_x
+                boxes[:, 1] += roi_y
+            else:
+                boxes = np.empty((0, 4), dtype=np.int64)
         
-        # Dilate to connect diagram parts
-        kernel_img = np.ones((5,5), np.uint8)
-        dilated_img_map = cv2.dilate(binary_no_text, kernel_img, iterations=2)
+        # Heuristics for diagrams, on all blobs at once
+        bw, bh = boxes[:, 2], boxes[:, 3]
+        keep = (bw > 30) & (bh > 30) & (bw * bh > 1000)
+        keep &= ~((bw > 0.9 * img_w) & (bh > 0.9 * img_h))  # Likely full page border
+        kept_ids = np.flatnonzero(keep)
         
-        contours, _ = cv2.findContours(dilated_img_map, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # Blobs sitting inside another diagram's box are already part of its
+        # crop (findContours' RETR_EXTERNAL skipped blobs in holes likewise)
+        if len(kept_ids) > 1:
+            kx0, ky0 = boxes[kept_ids, 0], boxes[kept_ids, 1]
+            kx1, ky1 = kx0 + boxes[kept_ids, 2], ky0 + boxes[kept_ids, 3]
+            inside = ((kx0[:, None] >= kx0) & (ky0[:, None] >= ky0) &
+                      (kx1[:, None] <= kx1) & (ky1[:, None] <= ky1))
+            same = ((kx0[:, None] == kx0) & (ky0[:, None] == ky0) &
+                    (kx1[:, None] == kx1) & (ky1[:, None] == ky1))
+            kept_ids = kept_ids[~(inside & ~same).any(axis=1)]
         
         image_objects = []
-        mask_images = np.zeros((img_h, img_w), dtype=np.uint8)
+        image_rects = []
         
-        for idx, cnt in enumerate(contours):
-            x, y, w, h = cv2.boundingRect(cnt)
-            area = w * h
+        for idx in kept_ids.tolist():
+            x, y, w, h = boxes[idx].tolist()
             
-            # Heuristics for diagrams
-            if w > 30 and h > 30 and area > 1000:
-                if w > 0.9 * img_w and h > 0.9 * img_h:
-                    continue # Likely full page border
-                    
-                pad = 10
-                x_p, y_p = max(0, x - pad), max(0, y - pad)
-                w_p, h_p = min(img_w - x_p, w + 2*pad), min(img_h - y_p, h + 2*pad)
-                
-                crop = img[y_p:y_p+h_p, x_p:x_p+w_p]
-                
-                img_obj = {
-                    "path": "", 
-                    "box": [x_p, y_p, w_p, h_p],
-                    "crop": crop,
-                    "id": idx
-                }
-                image_objects.append(img_obj)
-                cv2.rectangle(mask_images, (x_p, y_p), (x_p+w_p, y_p+h_p), 255, -1)
+            pad = 10
+            x_p, y_p = max(0, x - pad), max(0, y - pad)
+            w_p, h_p = min(img_w - x_p, w + 2*pad), min(img_h - y_p, h + 2*pad)
+            
+            crop = img[y_p:y_p+h_p, x_p:x_p+w_p]
+            
+            img_obj = {
+                "path": "", 
+                "box": [x_p, y_p, w_p, h_p],
+                "crop": crop,
+                "id": idx
+            }
+            image_objects.append(img_obj)
+            image_rects.append((x_p, y_p, x_p+w_p, y_p+h_p))
         
         # 3. Save Image Objects
+        # Paths are set now, the files are written in the background: call
+        # flush() before reading them (crops are views of img, so leave it as is)
         if output_dir:
             output_dir = Path(output_dir)
-            output_dir.mkdir(exist_ok=True, parents=True)
             for img_obj in image_objects:
-                img_filename = f"{Path(image_path).stem}_img_{img_obj['id']}.png"
+                img_filename = f"{stem}_img_{img_obj['id']}.png"
                 img_path_out = output_dir / img_filename
-                cv2.imwrite(str(img_path_out), img_obj['crop'])
                 img_obj['path'] = str(img_path_out)
+                self._write_image(img_obj['path'], img_obj['crop'])
         
         # 4. Create Clean Background
-        # Mask out both text and extracted images to leave just the background
-        full_mask = cv2.bitwise_or(mask_text, mask_images)
-        kernel_text_bg = np.ones((7,7), np.uint8)
-        full_mask = cv2.dilate(full_mask, kernel_text_bg, iterations=2)
-        
         # Remove NotebookLM icon/watermark from bottom-right corner
         # Icon is approximately at 91% from left, 96% from top, 8% width x 4% height
         icon_left = int(0.91 * img_w)
         icon_top = int(0.95 * img_h)
-        full_mask[icon_top:, icon_left:] = 255  # Mark for inpainting
+        # The icon sits on plain slide background, so paint it with the median
+        # colour of the strip just above it instead of inpainting it; this also
+        # keeps the corner out of the (area-proportional) inpaint below
+        base = img.copy()
+        strip = img[max(0, icon_top - 20):icon_top, icon_left:]
+        if strip.size:
+            base[icon_top:, icon_left:] = np.median(strip.reshape(-1, 3), axis=0)
+        else:
+            base[icon_top:, icon_left:] = 255
         
-        clean_image = cv2.inpaint(img, full_mask, 3, cv2.INPAINT_NS)
+        if not (text_rects or image_rects):
+            # Nothing to mask out, so nothing to inpaint
+            clean_image = base
+        else:
+            # Mask out both text and extracted images to leave just the background
+            # (dilated by filling the grown boxes, not by a pass over the page)
+            full_mask = self._buffer("full", (img_h, img_w))
+            full_mask.fill(0)
+            fill_rects(full_mask, grow_rects(text_rects + image_rects, _GROW_BACKGROUND, full_mask.shape))
+            full_mask[icon_top:, icon_left:] = 0
+            
+            clean_image = fill_background(base, full_mask)
         
-        # Debug Output
-        if output_dir:
+        # Debug Output (opt-in: a full page copy plus a JPG encode per page)
+        if debug and output_dir:
             debug_img = img.copy()
             for b in grouped_blocks:
                 x, y, w, h = b['box']
@@ -206,12 +343,13 @@ class DirectSlideExtractor:
             for i in image_objects:
                 x, y, w, h = i['box']
                 cv2.rectangle(debug_img, (x, y), (x+w, y+h), (0, 0, 255), 2)
-            cv2.imwrite(str(output_dir / f"{Path(image_path).stem}_debug_direct.jpg"), debug_img)
+            cv2.imwrite(str(output_dir / f"{stem}_debug_direct.jpg"), debug_img)
             
         return {
             "text_blocks": grouped_blocks,
             "image_objects": image_objects,
-            "clean_image": clean_image
+            "clean_image": clean_image,
+            "image_size": (img_w, img_h)
         }
 
     def _group_text_spans(self, raw_blocks):
@@ -226,22 +364,24 @@ class DirectSlideExtractor:
         raw_blocks.sort(key=lambda b: (b['box'][1], b['box'][0]))
         
         merged = []
-        if not raw_blocks:
-            return []
-            
+        
+        # The group being built is kept in locals (box as x0, y0, x1, y1 and
+        # its text parts) so each span costs a few int ops instead of repeated
+        # dict/list lookups and string concatenation. Merging still compares
+        # against the whole group so far, exactly as before.
         curr = raw_blocks[0]
+        cx0, cy0, cw, ch = curr['box']
+        cx1, cy1 = cx0 + cw, cy0 + ch
+        parts = [curr['text']]
         
         for next_b in raw_blocks[1:]:
+            nx0, ny0, nw, nh = next_b['box']
+            
             # Check for merging
             # Same alignment? Close vertically?
-            
-            x_diff = abs(curr['box'][0] - next_b['box'][0])
-            
-            curr_bottom = curr['box'][1] + curr['box'][3]
-            next_top = next_b['box'][1]
-            y_dist = next_top - curr_bottom
-            
-            line_height = curr['box'][3]
+            x_diff = abs(cx0 - nx0)
+            y_dist = ny0 - cy1
+            line_height = cy1 - cy0
             
             # Merging Logic:
             # 1. Horizontal alignment (strict)
@@ -250,19 +390,35 @@ class DirectSlideExtractor:
             
             # Simple heuristic for now:
             if x_diff < 10 and y_dist < line_height * 1.5 and y_dist >= -5:
-                # Merge
-                curr['text'] += " " + next_b['text']
-                
-                # Expand box
-                x1 = min(curr['box'][0], next_b['box'][0])
-                y1 = min(curr['box'][1], next_b['box'][1])
-                x2 = max(curr['box'][0] + curr['box'][2], next_b['box'][0] + next_b['box'][2])
-                y2 = max(curr['box'][1] + curr['box'][3], next_b['box'][1] + next_b['box'][3])
-                
-                curr['box'] = [x1, y1, x2-x1, y2-y1]
+                # Merge: extend text and expand box
+                parts.append(next_b['text'])
+                cx0, cy0 = min(cx0, nx0), min(cy0, ny0)
+                cx1, cy1 = max(cx1, nx0 + nw), max(cy1, ny0 + nh)
             else:
+                curr['text'] = " ".join(parts)
+                curr['box'] = [cx0, cy0, cx1 - cx0, cy1 - cy0]
                 merged.append(curr)
-                curr = next_b
                 
+                curr = next_b
+                cx0, cy0, cx1, cy1 = nx0, ny0, nx0 + nw, ny0 + nh
+                parts = [curr['text']]
+        
+        curr['text'] = " ".join(parts)
+        curr['box'] = [cx0, cy0, cx1 - cx0, cy1 - cy0]
         merged.append(curr)
         return merged
+
+
+_worker_extractor = None
+
+
+def get_worker_extractor() -> DirectSlideExtractor:
+    """One extractor per worker process, so its document cache lives across that worker's pages"""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = DirectSlideExtractor()
+        # Pool workers exit without running atexit hooks, but multiprocessing
+        # runs its finalizers, so the cached documents are closed on exit
+        Finalize(_worker_extractor, _worker_extractor.close, exitpriority=10)
+    return _worker_extractor
+
@@ -1,73 +1,162 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import queue
+import functools
 import sys
 import os
-import cv2
-import numpy as np
 try:
     import windnd
 except ImportError:
     print("windnd module not installed, drag-and-drop functionality will not be available.")
     windnd = None
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+# OpenCV, NumPy, python-pptx, Spire and the pywin32 automation stack are
+# imported where a conversion needs them, so the window opens without them
 from .cli import process_pdf_to_ppt
-from .ppt_combiner import combine_ppt
-from .pdf2png import pdf_to_png
-from .utils.screenshot_automation import screen_width, screen_height
+from .pipeline import extract_pages, jpeg_params, open_result, render_pages, write_jpeg
+from .config import MAX_CONCURRENT_PAGES
+
+def _clean_simple_page(png_file, png_dir, params=None):
+    """Remove the NotebookLM icon from a page PNG and save it as the slide background"""
+    import cv2
+    
+    img = cv2.imread(str(png_file))
+    if img is None:
+        raise ValueError(f"Could not read image: {png_file}")
+    img_h, img_w = img.shape[:2]
+    
+    # Apply NotebookLM icon removal to original image
+    icon_mask = _icon_mask(img_h, img_w)
+    clean_img = cv2.inpaint(img, icon_mask, 3, cv2.INPAINT_NS)
+    
+    # Save cleaned original as background
+    clean_bg_path = png_dir / f"{png_file.stem}_simple.jpg"
+    write_jpeg(clean_bg_path, clean_img, params or [])
+    return clean_bg_path, (img_w, img_h)
+
+
+@functools.lru_cache(maxsize=4)
+def _icon_mask(img_h, img_w):
+    """Inpaint mask for the NotebookLM icon corner; built once per page size (read-only)"""
+    import numpy as np
+    
+    icon_left = int(0.91 * img_w)
+    icon_top = int(0.95 * img_h)
+    mask = np.zeros((img_h, img_w), dtype=np.uint8)
+    mask[icon_top:, icon_left:] = 255
+    return mask
+
 
 class TextRedirector:
-    def __init__(self, widget, tag="stdout"):
-        self.widget = widget
+    """
+    File-like stdout/stderr replacement that only queues text.
+    
+    Writes come from worker threads, which must not touch Tk; the GUI drains
+    the queue on its own event loop (AppGUI._pump_logs).
+    """
+    def __init__(self, log_queue, tag="stdout"):
+        self.log_queue = log_queue
         self.tag = tag
 
     def write(self, str):
-        self.widget.configure(state='normal')
-        self.widget.insert(tk.END, str, (self.tag,))
-        self.widget.see(tk.END)
-        self.widget.configure(state='disabled')
+        self.log_queue.put((self.tag, str))
 
     def flush(self):
         pass
 
 class AppGUI:
+    # Oldest log lines are dropped past this, so the widget (and the cost of
+    # each insert) stays bounded on long conversions
+    LOG_MAX_LINES = 5000
+    # Queued log text is written to the widget in one batch per tick
+    LOG_PUMP_MS = 30
+    LOG_PUMP_BATCH = 200
+
     def __init__(self, root):
         self.root = root
         self.root.title("PDF to PPT Converter")
         self.root.geometry("850x700")
         
+        # Pending debounced drop-zone check (see _on_pdf_path_changed) and
+        # the path it last looked at
+        self._path_check_id = None
+        self._last_checked_path = None
+        # Last multi-file drop; the first one is also put in the path field
+        self._dropped_pdfs = []
+        
         self.setup_ui()
         
         # Save original stdout/stderr
         self.old_stdout = sys.stdout
         self.old_stderr = sys.stderr
         
-        # Redirect stdout and stderr
-        sys.stdout = TextRedirector(self.log_area, "stdout")
-        sys.stderr = TextRedirector(self.log_area, "stderr")
+        # Redirect stdout and stderr through one queue, so their order is kept
+        self.log_queue = queue.Queue()
+        sys.stdout = TextRedirector(self.log_queue, "stdout")
+        sys.stderr = TextRedirector(self.log_queue, "stderr")
+        self._pump_logs()
         
         if windnd:
             windnd.hook_dropfiles(self.root, func=self.on_drop_files)
         
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+    def _pump_logs(self):
+        """Move queued log text into the log widget, then reschedule itself"""
+        runs = []  # [tag, [chunks]] for consecutive writes with the same tag
+        try:
+            for _ in range(self.LOG_PUMP_BATCH):
+                tag, text = self.log_queue.get_nowait()
+                if runs and runs[-1][0] == tag:
+                    runs[-1][1].append(text)
+                else:
+                    runs.append([tag, [text]])
+        except queue.Empty:
+            pass
+        
+        if runs:
+            # Autoscroll only when the view was already at the bottom, so the
+            # single see() per tick does not yank a user reading older lines
+            follow = self.log_area.yview()[1] >= 0.999
+            self.log_area.configure(state='normal')
+            for tag, chunks in runs:
+                self.log_area.insert(tk.END, ''.join(chunks), (tag,))
+            line_count = int(self.log_area.index('end-1c').split('.')[0])
+            if line_count > self.LOG_MAX_LINES:
+                self.log_area.delete('1.0', f'{line_count - self.LOG_MAX_LINES + 1}.0')
+            if follow:
+                self.log_area.see(tk.END)
+            self.log_area.configure(state='disabled')
+        
+        self.root.after(self.LOG_PUMP_MS, self._pump_logs)
+
     def on_drop_files(self, files):
         if files:
-            # Get the first file dropped
-            file_path = files[0].decode('gbk') if isinstance(files[0], bytes) else files[0]
-            if file_path.lower().endswith('.pdf'):
-                self.pdf_path_var.set(file_path)
+            paths = [f.decode('gbk') if isinstance(f, bytes) else f for f in files]
+            pdfs = [p for p in paths if p.lower().endswith('.pdf')]
+            if pdfs:
+                # The first PDF goes in the path field; any others are
+                # converted after it, one by one, with the same settings
+                self._dropped_pdfs = pdfs
+                self.pdf_path_var.set(pdfs[0])
                 self._update_drop_zone_success()
-                print(f"File selected via drag-and-drop: {file_path}")
+                for pdf in pdfs:
+                    print(f"File selected via drag-and-drop: {pdf}")
+                if len(pdfs) < len(paths):
+                    print(f"Skipped {len(paths) - len(pdfs)} non-PDF file(s)")
             else:
                 messagebox.showwarning("Warning", "Only PDF files are supported")
     
     def _update_drop_zone_success(self):
         """Update drop zone to show file is loaded"""
-        self.drop_zone_label.config(
-            text="✅ PDF Loaded! Drag another to replace.",
-            foreground="#28a745"
-        )
+        dropped = self._dropped_pdfs
+        if len(dropped) > 1 and os.path.normpath(dropped[0]) == os.path.normpath(self.pdf_path_var.get().strip()):
+            text = f"✅ {len(self._dropped_pdfs)} PDFs queued! Drag again to replace."
+        else:
+            text = "✅ PDF Loaded! Drag another to replace."
+        self.drop_zone_label.config(text=text, foreground="#28a745")
     
     def _update_drop_zone_default(self):
         """Reset drop zone to default state"""
@@ -240,39 +329,44 @@ class AppGUI:
         self.inpaint_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(opt_frame, text="Remove Watermark", variable=self.inpaint_var).grid(row=0, column=2, columnspan=2, sticky=tk.W, padx=10)
 
-        # Screenshot mode options (hidden by default)
+        # Screenshot mode options (hidden by default). Both rows live in one
+        # container, so switching modes shows/hides a single grid slave
         self.screenshot_options_frame = ttk.Frame(opt_frame)
-        self.screenshot_options_frame.grid(row=1, column=0, columnspan=6, sticky=tk.W, pady=5)
+        self.screenshot_options_frame.grid(row=1, column=0, columnspan=6, sticky=tk.W)
+        self._screenshot_options_shown = True
+        
+        timing_frame = ttk.Frame(self.screenshot_options_frame)
+        timing_frame.pack(anchor=tk.W, pady=5)
         
-        ttk.Label(self.screenshot_options_frame, text="Delay (sec):").pack(side=tk.LEFT)
+        ttk.Label(timing_frame, text="Delay (sec):").pack(side=tk.LEFT)
         self.delay_var = tk.IntVar(value=2)
-        delay_entry = ttk.Entry(self.screenshot_options_frame, textvariable=self.delay_var, width=8)
+        delay_entry = ttk.Entry(timing_frame, textvariable=self.delay_var, width=8)
         delay_entry.pack(side=tk.LEFT, padx=(5, 15))
 
-        ttk.Label(self.screenshot_options_frame, text="Timeout (sec):").pack(side=tk.LEFT)
+        ttk.Label(timing_frame, text="Timeout (sec):").pack(side=tk.LEFT)
         self.timeout_var = tk.IntVar(value=50)
-        timeout_entry = ttk.Entry(self.screenshot_options_frame, textvariable=self.timeout_var, width=8)
+        timeout_entry = ttk.Entry(timing_frame, textvariable=self.timeout_var, width=8)
         timeout_entry.pack(side=tk.LEFT, padx=(5, 15))
 
-        ttk.Label(self.screenshot_options_frame, text="Display Ratio:").pack(side=tk.LEFT)
+        ttk.Label(timing_frame, text="Display Ratio:").pack(side=tk.LEFT)
         self.ratio_var = tk.DoubleVar(value=0.8)
-        ratio_entry = ttk.Entry(self.screenshot_options_frame, textvariable=self.ratio_var, width=8)
+        ratio_entry = ttk.Entry(timing_frame, textvariable=self.ratio_var, width=8)
         ratio_entry.pack(side=tk.LEFT, padx=(5, 15))
         
-        ttk.Label(self.screenshot_options_frame, text="PC Mgr Ver:").pack(side=tk.LEFT)
+        ttk.Label(timing_frame, text="PC Mgr Ver:").pack(side=tk.LEFT)
         self.pc_mgr_version_var = tk.StringVar(value="3.19")
-        pc_mgr_entry = ttk.Entry(self.screenshot_options_frame, textvariable=self.pc_mgr_version_var, width=8)
+        pc_mgr_entry = ttk.Entry(timing_frame, textvariable=self.pc_mgr_version_var, width=8)
         pc_mgr_entry.pack(side=tk.LEFT, padx=5)
         
-        # Done offset row (screenshot mode only)
-        self.done_offset_frame = ttk.Frame(opt_frame)
-        self.done_offset_frame.grid(row=2, column=0, columnspan=6, sticky=tk.W, pady=5)
+        # Done offset row
+        done_offset_frame = ttk.Frame(self.screenshot_options_frame)
+        done_offset_frame.pack(anchor=tk.W, pady=5)
         
-        ttk.Label(self.done_offset_frame, text="Done Button Offset:").pack(side=tk.LEFT)
+        ttk.Label(done_offset_frame, text="Done Button Offset:").pack(side=tk.LEFT)
         self.done_offset_var = tk.StringVar(value="")
-        done_offset_entry = ttk.Entry(self.done_offset_frame, textvariable=self.done_offset_var, width=10)
+        done_offset_entry = ttk.Entry(done_offset_frame, textvariable=self.done_offset_var, width=10)
         done_offset_entry.pack(side=tk.LEFT, padx=5)
-        ttk.Label(self.done_offset_frame, text="(Leave empty for auto)", foreground="#666666").pack(side=tk.LEFT)
+        ttk.Label(done_offset_frame, text="(Leave empty for auto)", foreground="#666666").pack(side=tk.LEFT)
         
         # Initially hide screenshot-specific options
         self._on_mode_changed()
@@ -292,28 +386,53 @@ class AppGUI:
         log_frame = ttk.LabelFrame(main_frame, text="Log Output", padding="5")
         log_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-        self.log_area = scrolledtext.ScrolledText(log_frame, state='disabled', height=12)
+        # No wrapping: Tk would otherwise re-run line breaking on every insert,
+        # which gets slow on long tracebacks; long lines scroll sideways instead
+        self.log_area = scrolledtext.ScrolledText(log_frame, state='disabled', height=12, wrap=tk.NONE)
+        log_xscroll = ttk.Scrollbar(log_frame, orient=tk.HORIZONTAL, command=self.log_area.xview)
+        self.log_area.configure(xscrollcommand=log_xscroll.set)
+        log_xscroll.pack(side=tk.BOTTOM, fill=tk.X)
         self.log_area.pack(fill=tk.BOTH, expand=True)
         self.log_area.tag_config("stderr", foreground="red")
     
+    # Typing or pasting a path writes the variable once per character; the
+    # drop-zone check only runs once the path has been left alone this long
+    PATH_CHECK_DELAY_MS = 200
+
     def _on_pdf_path_changed(self, *args):
-        """Update drop zone when PDF path changes"""
+        """Schedule a drop zone update, replacing any not yet run"""
+        if self._path_check_id is not None:
+            self.root.after_cancel(self._path_check_id)
+        self._path_check_id = self.root.after(self.PATH_CHECK_DELAY_MS, self._check_pdf_path)
+
+    def _check_pdf_path(self):
+        """Update drop zone to match the current PDF path"""
+        self._path_check_id = None
         path = self.pdf_path_var.get().strip()
-        if path and os.path.exists(path) and path.lower().endswith('.pdf'):
+        # Writes that leave the value as it was (e.g. start_conversion
+        # storing the sanitized path) need no new stat or label update
+        if path == self._last_checked_path:
+            return
+        self._last_checked_path = path
+        if path and path.lower().endswith('.pdf') and os.path.exists(path):
             self._update_drop_zone_success()
         else:
             self._update_drop_zone_default()
     
     def _on_mode_changed(self):
         """Show/hide options based on selected mode"""
-        if self.ocr_mode_var.get():
-            # Background mode - hide screenshot-specific options
-            self.screenshot_options_frame.grid_remove()
-            self.done_offset_frame.grid_remove()
-        else:
+        # Re-clicking the selected radio button also lands here; only touch
+        # the layout when the visibility actually changes
+        show = not self.ocr_mode_var.get()
+        if show == self._screenshot_options_shown:
+            return
+        self._screenshot_options_shown = show
+        if show:
             # Screenshot mode - show all options
             self.screenshot_options_frame.grid()
-            self.done_offset_frame.grid()
+        else:
+            # Background mode - hide screenshot-specific options
+            self.screenshot_options_frame.grid_remove()
 
     def browse_pdf(self):
         # Clean up quotes and spaces in the path, convenient for users pasting paths with quotes
@@ -353,75 +472,139 @@ class AppGUI:
         if not pdf_path or not os.path.exists(pdf_path):
             messagebox.showerror("Error", "Please select a valid PDF file")
             return
+        
+        # Tk variables are read here, on the Tk thread; the worker only gets values
+        try:
+            settings = self._read_settings()
+        except tk.TclError as e:
+            messagebox.showerror("Error", f"Invalid setting: {e}")
+            return
+
+        # The rest of a multi-file drop is converted after the first, as long
+        # as the path field still holds the first (browsing or typing another
+        # path replaces the batch)
+        batch = [settings]
+        if self._dropped_pdfs and os.path.normpath(self._dropped_pdfs[0]) == os.path.normpath(pdf_path):
+            batch += [dict(settings, pdf_file=pdf) for pdf in self._dropped_pdfs[1:]]
+        self._dropped_pdfs = []
 
         self.start_btn.config(state=tk.DISABLED)
         self.status_label.config(text="Converting...", foreground="#007bff")
         
-        if self.ocr_mode_var.get():
-            threading.Thread(target=self.run_ocr_conversion, daemon=True).start()
-        else:
-            threading.Thread(target=self.run_screenshot_conversion, daemon=True).start()
+        convert = self.run_ocr_conversion if self.ocr_mode_var.get() else self.run_screenshot_conversion
+        threading.Thread(target=self._run_batch, args=(convert, batch), daemon=True).start()
 
-    def run_ocr_conversion(self):
-        """Run OCR/Direct extraction mode (background processing)"""
+    def _run_batch(self, convert, batch):
+        """Worker thread: convert each PDF in turn, then report once.
+
+        Tk is not thread-safe, so every widget or dialog call is handed to
+        the main loop through root.after via _finish_batch.
+        """
+        outputs, errors = [], []
         try:
-            from .direct_extractor import DirectSlideExtractor
-            from .ppt_generator import PPTCreator
-            import re
-            
-            pdf_file = self.pdf_path_var.get()
-            pdf_name = Path(pdf_file).stem
-            workspace_dir = Path(self.output_dir_var.get())
-            png_dir = workspace_dir / f"{pdf_name}_pngs"
-            
-            output_type = self.output_type_var.get()
-            suffix = "_simple" if output_type == "simple" else "_complex"
-            out_ppt_file = workspace_dir / f"{pdf_name}{suffix}.pptx"
-            
-            workspace_dir.mkdir(exist_ok=True, parents=True)
-            
-            mode_name = "Simple (Image-based)" if output_type == "simple" else "Complex (Editable Text)"
-            print("=" * 60)
-            print(f"NotebookLM2PPT - {mode_name}")
-            print("=" * 60)
-            print(f"PDF File: {pdf_file}")
-            print(f"Output: {out_ppt_file}")
-            print("You can continue using your computer while this runs!")
-            print()
+            for n, settings in enumerate(batch, 1):
+                if len(batch) > 1:
+                    print(f"\n>>> PDF {n}/{len(batch)}: {settings['pdf_file']}")
+                try:
+                    outputs.append(convert(settings))
+                except Exception as e:
+                    print(f"\nError occurred: {str(e)}")
+                    errors.append(f"{Path(settings['pdf_file']).name}: {e}")
+
+            if len(outputs) == 1 and not errors:
+                open_result(outputs[0])
+        finally:
+            self.root.after(0, self._finish_batch, outputs, errors)
+
+    def _finish_batch(self, outputs, errors):
+        """Main thread: report the batch result and re-enable the button"""
+        self.start_btn.config(state=tk.NORMAL)
+        if errors:
+            self.status_label.config(text="❌ Error", foreground="#dc3545")
+            message = "An error occurred during conversion:\n" + "\n".join(errors)
+            if outputs:
+                message += "\n\nSaved:\n" + "\n".join(outputs)
+            messagebox.showerror("Error", message)
+        elif outputs:
+            self.status_label.config(text="✅ Complete!", foreground="#28a745")
+            messagebox.showinfo("Success", "Conversion complete!\nFile saved to: " + "\n".join(outputs))
+
+    def _read_settings(self):
+        """Snapshot of the form values for one conversion"""
+        return {
+            "pdf_file": self.pdf_path_var.get(),
+            "workspace_dir": Path(self.output_dir_var.get()),
+            "output_type": self.output_type_var.get(),
+            "dpi": self.dpi_var.get(),
+            "inpaint": self.inpaint_var.get(),
+            "delay": self.delay_var.get(),
+            "timeout": self.timeout_var.get(),
+            "ratio": self.ratio_var.get(),
+            "pc_manager_version": self.pc_mgr_version_var.get(),
+            "done_offset": self.done_offset_var.get().strip(),
+        }
+
+    def run_ocr_conversion(self, settings):
+        """Run OCR/Direct extraction mode for one PDF; returns the output path"""
+        import fitz  # PyMuPDF
+        from .ppt_generator import PPTCreator
+        
+        pdf_file = settings["pdf_file"]
+        pdf_name = Path(pdf_file).stem
+        workspace_dir = settings["workspace_dir"]
+        png_dir = workspace_dir / f"{pdf_name}_pngs"
+        dpi = settings["dpi"]
+        
+        output_type = settings["output_type"]
+        suffix = "_simple" if output_type == "simple" else "_complex"
+        out_ppt_file = workspace_dir / f"{pdf_name}{suffix}.pptx"
+        
+        os.makedirs(png_dir, exist_ok=True)
+        
+        mode_name = "Simple (Image-based)" if output_type == "simple" else "Complex (Editable Text)"
+        print("=" * 60)
+        print(f"NotebookLM2PPT - {mode_name}")
+        print("=" * 60)
+        print(f"PDF File: {pdf_file}")
+        print(f"Output: {out_ppt_file}")
+        print("You can continue using your computer while this runs!")
+        print()
+        
+        ppt_creator = PPTCreator()
+        
+        if output_type == "simple":
+            with fitz.open(pdf_file) as doc:
+                page_count = doc.page_count
             
-            # 1. Convert PDF to PNGs
+            # 1. Convert PDF to PNGs on a background thread; each page is
+            # queued as soon as its PNG is on disk, so rendering overlaps
+            # the cleanup below instead of finishing first
             print("Step 1: Converting PDF to PNG images...")
-            pdf_to_png(pdf_file, png_dir, dpi=self.dpi_var.get(), inpaint=False)
-            
-            # 2. Process slides based on output type
-            extractor = DirectSlideExtractor()
-            ppt_creator = PPTCreator()
-            
-            all_pngs = sorted(png_dir.glob("page_*.png"))
-            png_files = [p for p in all_pngs if re.match(r"page_\d{4}\.png", p.name)]
+            pages = queue.Queue()
+            threading.Thread(
+                target=render_pages,
+                args=(pdf_file, png_dir, dpi, False, pages),
+                daemon=True
+            ).start()
             
-            print(f"\nProcessing {len(png_files)} pages ({output_type} mode)...")
-            
-            for idx, png_file in enumerate(png_files):
-                print(f"[{idx+1}/{len(png_files)}] Processing {png_file.name}...")
-                
-                try:
-                    if output_type == "simple":
-                        # SIMPLE MODE: Just use original image as background
-                        # No text extraction, preserves exact layout
-                        img = cv2.imread(str(png_file))
-                        img_h, img_w = img.shape[:2]
-                        
-                        # Apply NotebookLM icon removal to original image
-                        icon_left = int(0.91 * img_w)
-                        icon_top = int(0.95 * img_h)
-                        mask = np.zeros((img_h, img_w), dtype=np.uint8)
-                        mask[icon_top:, icon_left:] = 255
-                        clean_img = cv2.inpaint(img, mask, 3, cv2.INPAINT_NS)
-                        
-                        # Save cleaned original as background
-                        clean_bg_path = png_dir / f"{png_file.stem}_simple.jpg"
-                        cv2.imwrite(str(clean_bg_path), clean_img)
+            # 2. SIMPLE MODE: Just use original image as background
+            # No text extraction, preserves exact layout. Pages are read,
+            # inpainted and written on a thread pool (all of it releases
+            # the GIL); slides are added in page order as results arrive.
+            print(f"\nProcessing {page_count} pages ({output_type} mode)...")
+            # Backgrounds are saved with the same JPEG settings as complex mode
+            params = jpeg_params()
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as pool:
+                jobs = []
+                for png_file in iter(pages.get, None):
+                    if isinstance(png_file, Exception):
+                        # Rendering stopped early; do not save a truncated deck
+                        raise RuntimeError(f"Failed to render PDF pages: {png_file}") from png_file
+                    jobs.append((png_file, pool.submit(_clean_simple_page, png_file, png_dir, params)))
+                for idx, (png_file, future) in enumerate(jobs):
+                    try:
+                        clean_bg_path, (img_w, img_h) = future.result()
+                        print(f"[{idx+1}/{page_count}] Processed {png_file.name}")
                         
                         # Add slide with just the image (no text boxes)
                         ppt_creator.add_slide(
@@ -430,112 +613,102 @@ class AppGUI:
                             [],  # No image objects
                             (img_w, img_h)
                         )
-                    else:
-                        # COMPLEX MODE: Full extraction with editable text
-                        slide_data = extractor.process_page(
-                            pdf_path=pdf_file,
-                            image_path=str(png_file),
-                            output_dir=png_dir,
-                            page_num=idx
-                        )
-                        
-                        # Save clean background
-                        clean_bg_path = png_dir / f"{png_file.stem}_clean.jpg"
-                        cv2.imwrite(str(clean_bg_path), slide_data["clean_image"])
-                        
-                        # Add to PPT with text boxes and image objects
-                        img_h, img_w = slide_data["clean_image"].shape[:2]
-                        ppt_creator.add_slide(
-                            str(clean_bg_path),
-                            slide_data["text_blocks"],
-                            slide_data["image_objects"],
-                            (img_w, img_h)
-                        )
-                        
+                    except Exception as e:
+                        print(f"Error processing page {idx}: {e}")
+                        import traceback
+                        traceback.print_exc()
+        else:
+            # COMPLEX MODE: Full extraction with editable text. Worker
+            # processes render and extract pages in parallel (the
+            # extractor and fitz documents are not thread-safe), the same
+            # path the CLI's --ocr mode takes
+            with fitz.open(pdf_file) as doc:
+                page_count = doc.page_count
+            
+            print(f"\nProcessing {page_count} pages ({output_type} mode, {MAX_CONCURRENT_PAGES} workers)...")
+            results = extract_pages(pdf_file, page_count, dpi, png_dir)
+            
+            for idx in sorted(results):
+                slide_data, clean_bg_path, write_future = results[idx]
+                try:
+                    # python-pptx reads the background from disk
+                    write_future.result()
+                    
+                    # Add to PPT with text boxes and image objects
+                    ppt_creator.add_slide(
+                        str(clean_bg_path),
+                        slide_data["text_blocks"],
+                        slide_data["image_objects"],
+                        slide_data["image_size"]
+                    )
                 except Exception as e:
-                    print(f"Error processing page {idx}: {e}")
+                    print(f"Error adding page {idx}: {e}")
                     import traceback
                     traceback.print_exc()
-            
-            ppt_creator.save(out_ppt_file)
-            
-            print("\n" + "=" * 60)
-            print(f"Done! PPT saved to: {out_ppt_file}")
-            print("=" * 60)
-            
-            out_ppt_file = os.path.abspath(out_ppt_file)
-            os.startfile(out_ppt_file)
-            
-            self.root.after(0, lambda: self.status_label.config(text="✅ Complete!", foreground="#28a745"))
-            messagebox.showinfo("Success", f"Conversion complete!\nFile saved to: {out_ppt_file}")
-            
-        except Exception as e:
-            print(f"\nError occurred: {str(e)}")
-            self.root.after(0, lambda: self.status_label.config(text="❌ Error", foreground="#dc3545"))
-            messagebox.showerror("Error", f"An error occurred during conversion: {str(e)}")
-        finally:
-            self.root.after(0, lambda: self.start_btn.config(state=tk.NORMAL))
-
-    def run_screenshot_conversion(self):
-        """Run screenshot mode (legacy, takes control of computer)"""
-        try:
-            pdf_file = self.pdf_path_var.get()
-            pdf_name = Path(pdf_file).stem
-            workspace_dir = Path(self.output_dir_var.get())
-            png_dir = workspace_dir / f"{pdf_name}_pngs"
-            ppt_dir = workspace_dir / f"{pdf_name}_ppt"
-            out_ppt_file = workspace_dir / f"{pdf_name}.pptx"
-            
-            workspace_dir.mkdir(exist_ok=True, parents=True)
+        
+        ppt_creator.save(out_ppt_file)
+        
+        print("\n" + "=" * 60)
+        print(f"Done! PPT saved to: {out_ppt_file}")
+        print("=" * 60)
+        
+        return os.path.abspath(out_ppt_file)
+
+    def run_screenshot_conversion(self, settings):
+        """Run screenshot mode (legacy, takes control of computer) for one PDF; returns the output path"""
+        pdf_file = settings["pdf_file"]
+        pdf_name = Path(pdf_file).stem
+        workspace_dir = settings["workspace_dir"]
+        png_dir = workspace_dir / f"{pdf_name}_pngs"
+        ppt_dir = workspace_dir / f"{pdf_name}_ppt"
+        out_ppt_file = workspace_dir / f"{pdf_name}.pptx"
+        
+        os.makedirs(png_dir, exist_ok=True)
+        os.makedirs(ppt_dir, exist_ok=True)
+
+        offset_raw = settings["done_offset"]
+        done_offset = None
+        if offset_raw:
+            try:
+                done_offset = int(offset_raw)
+            except ValueError:
+                raise ValueError("Done button offset must be an integer or left empty")
+
+        from .ppt_combiner import combine_ppt
+        from .utils.screenshot_automation import screen_size
+        
+        screen_width, screen_height = screen_size()
+        ratio = min(screen_width/16, screen_height/9)
+        max_display_width = int(16 * ratio)
+        max_display_height = int(9 * ratio)
+
+        display_width = int(max_display_width * settings["ratio"])
+        display_height = int(max_display_height * settings["ratio"])
+
+        print(f"Starting to process: {pdf_file}")
+        print(f"Done button offset: {done_offset if done_offset is not None else 'auto by version'}")
+        print("⚠️ WARNING: Screenshot mode will take control of your mouse/keyboard!")
+        print("Do not touch your computer until conversion is complete.")
+        print()
+        
+        process_pdf_to_ppt(
+            pdf_path=pdf_file,
+            png_dir=png_dir,
+            ppt_dir=ppt_dir,
+            delay_between_images=settings["delay"],
+            inpaint=settings["inpaint"],
+            dpi=settings["dpi"],
+            timeout=settings["timeout"],
+            display_height=display_height,
+            display_width=display_width,
+            pc_manager_version=settings["pc_manager_version"],
+            done_button_offset=done_offset
+        )
 
-            offset_raw = self.done_offset_var.get().strip()
-            done_offset = None
-            if offset_raw:
-                try:
-                    done_offset = int(offset_raw)
-                except ValueError:
-                    raise ValueError("Done button offset must be an integer or left empty")
-
-            ratio = min(screen_width/16, screen_height/9)
-            max_display_width = int(16 * ratio)
-            max_display_height = int(9 * ratio)
-
-            display_width = int(max_display_width * self.ratio_var.get())
-            display_height = int(max_display_height * self.ratio_var.get())
-
-            print(f"Starting to process: {pdf_file}")
-            print(f"Done button offset: {done_offset if done_offset is not None else 'auto by version'}")
-            print("⚠️ WARNING: Screenshot mode will take control of your mouse/keyboard!")
-            print("Do not touch your computer until conversion is complete.")
-            print()
-            
-            process_pdf_to_ppt(
-                pdf_path=pdf_file,
-                png_dir=png_dir,
-                ppt_dir=ppt_dir,
-                delay_between_images=self.delay_var.get(),
-                inpaint=self.inpaint_var.get(),
-                dpi=self.dpi_var.get(),
-                timeout=self.timeout_var.get(),
-                display_height=display_height,
-                display_width=display_width,
-                pc_manager_version=self.pc_mgr_version_var.get(),
-                done_button_offset=done_offset
-            )
-
-            combine_ppt(ppt_dir, out_ppt_file)
-            out_ppt_file = os.path.abspath(out_ppt_file)
-            print(f"\nConversion complete! Final file: {out_ppt_file}")
-            os.startfile(out_ppt_file)
-            
-            self.root.after(0, lambda: self.status_label.config(text="✅ Complete!", foreground="#28a745"))
-            messagebox.showinfo("Success", f"Conversion complete!\nFile saved to: {out_ppt_file}")
-        except Exception as e:
-            print(f"\nError occurred: {str(e)}")
-            self.root.after(0, lambda: self.status_label.config(text="❌ Error", foreground="#dc3545"))
-            messagebox.showerror("Error", f"An error occurred during conversion: {str(e)}")
-        finally:
-            self.root.after(0, lambda: self.start_btn.config(state=tk.NORMAL))
+        combine_ppt(ppt_dir, out_ppt_file)
+        out_ppt_file = os.path.abspath(out_ppt_file)
+        print(f"\nConversion complete! Final file: {out_ppt_file}")
+        return out_ppt_file
 
 def launch_gui():
     root = tk.Tk()
@@ -5,10 +5,19 @@ These models represent the structured data extracted from PDF slides
 and used throughout the conversion pipeline.
 """
 
+import sys
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
+# Elements are created per detected item on every page, so on Python 3.10+
+# they get __slots__ (no per-instance __dict__); older versions keep plain
+# dataclasses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class TextRole(Enum):
     """Role/type of a text element in a slide."""
@@ -45,7 +54,7 @@ class ExtractionQuality(Enum):
     LOW = "low"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BoundingBox:
     """Bounding box for an element."""
     x: int
@@ -83,9 +92,27 @@ class BoundingBox:
     @classmethod
     def from_tuple(cls, bbox: Tuple[int, int, int, int]) -> "BoundingBox":
         return cls(x=bbox[0], y=bbox[1], width=bbox[2], height=bbox[3])
+    
+    @classmethod
+    def from_row(cls, boxes: np.ndarray, i: int) -> "BoundingBox":
+        """Build a box from row i of an (N, 4) x, y, width, height array."""
+        x, y, width, height = boxes[i].tolist()
+        return cls(x=x, y=y, width=width, height=height)
 
 
-@dataclass
+def bbox_array(elements) -> np.ndarray:
+    """
+    Boxes of elements (anything with a .bbox) as one (N, 4) int32 array.
+    
+    Columns are x, y, width, height, so overlap and containment checks over
+    many elements can be done as NumPy broadcasts instead of per-object
+    property calls; BoundingBox.from_row converts a row back.
+    """
+    boxes = np.array([e.bbox.as_tuple() for e in elements], dtype=np.int32)
+    return boxes.reshape(-1, 4)
+
+
+@dataclass(**_SLOTS)
 class TextElement:
     """A text element extracted from a slide."""
     text: str
@@ -103,7 +130,7 @@ class TextElement:
         return self.bbox.as_tuple()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GraphicElement:
     """A graphic/image element extracted from a slide."""
     bbox: BoundingBox
@@ -120,7 +147,7 @@ class GraphicElement:
         return self.bbox.as_tuple()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BackgroundImage:
     """Background image data for a slide."""
     bbox: BoundingBox
@@ -130,7 +157,7 @@ class BackgroundImage:
     path: str = ""
 
 
-@dataclass 
+@dataclass(**_SLOTS)
 class VisionAnalysisResult:
     """Result from Vision API analysis of a slide."""
     text_elements: List[TextElement] = field(default_factory=list)
@@ -141,8 +168,17 @@ class VisionAnalysisResult:
     extraction_quality: ExtractionQuality = ExtractionQuality.MEDIUM
     used_vision_api: bool = False
     note: str = ""
+    
+    def text_bboxes(self) -> np.ndarray:
+        """Boxes of text_elements as an (N, 4) x, y, width, height array."""
+        return bbox_array(self.text_elements)
+    
+    def graphic_bboxes(self) -> np.ndarray:
+        """Boxes of graphics as an (N, 4) x, y, width, height array."""
+        return bbox_array(self.graphics)
 
 
+# One per page, so no __slots__ here: cached_property needs the instance __dict__
 @dataclass
 class SlideData:
     """Complete data for a single slide, ready for PPTX generation."""
@@ -155,9 +191,13 @@ class SlideData:
     clean_image: Optional[any] = None  # numpy array
     used_gemini: bool = False
     
-    @property
+    @cached_property
     def text_blocks_legacy(self) -> List[dict]:
-        """Convert to legacy dict format for backward compatibility."""
+        """
+        Convert to legacy dict format for backward compatibility.
+        
+        Built on first access and cached; later changes to text_blocks are not reflected.
+        """
         return [
             {
                 "text": t.text,
@@ -169,9 +209,13 @@ class SlideData:
             for t in self.text_blocks
         ]
     
-    @property
+    @cached_property
     def image_objects_legacy(self) -> List[dict]:
-        """Convert to legacy dict format for backward compatibility."""
+        """
+        Convert to legacy dict format for backward compatibility.
+        
+        Built on first access and cached; later changes to image_objects are not reflected.
+        """
         return [
             {
                 "path": g.path,
@@ -185,7 +229,7 @@ class SlideData:
         ]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExtractionResult:
     """Result from the complete extraction pipeline for a PDF."""
     slides: List[SlideData] = field(default_factory=list)
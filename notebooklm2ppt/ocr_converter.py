@@ -1,19 +1,114 @@
+import re
 import cv2
 import numpy as np
+import onnxruntime
 from rapidocr_onnxruntime import RapidOCR
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from .config import BLANK_PAGE_INK_RATIO, WATERMARK_PATTERNS
+from .utils.masks import fill_background, fill_rects, grow_rects
+
+# A k x k rect dilation repeated n times equals one (n*(k-1)+1)-square pass;
+# the single pass lets OpenCV run its separable row/column path once
+_KERNEL_IMG = cv2.getStructuringElement(cv2.MORPH_RECT, (9, 9))        # 5x5, iterations=2
+# The text and background masks are only filled boxes, which a (2r+1)-square
+# dilation grows by r a side, so they are filled pre-grown (see grow_rects)
+_GROW_TEXT = 9     # 19x19: 7x7, iterations=3
+_GROW_TEXT_BG = 6  # 13x13: 7x7, iterations=2, on top of the text mask
+
+# _fix_ocr_text patterns, compiled once instead of looked up per text block
+_CAMEL_RE = re.compile(r'([a-z])([A-Z])')
+_PUNCT_RE = re.compile(r'([,;:])([A-Za-z])')
+_PERIOD_RE = re.compile(r'\.([A-Z])')
+_SPACES_RE = re.compile(r'  +')
+_VS_RE = re.compile(r'(\w)vs(\w)')
+
+# Every watermark pattern in one case-insensitive search per text block
+_WATERMARK_RE = re.compile('|'.join(re.escape(p) for p in WATERMARK_PATTERNS), re.IGNORECASE) if WATERMARK_PATTERNS else None
+
+
+def _intersection_areas(boxes_a, boxes_b):
+    """(N, M) intersection areas between two (N, 4) and (M, 4) [x, y, w, h] int arrays"""
+    ax0, ay0 = boxes_a[:, 0:1], boxes_a[:, 1:2]
+    ax1, ay1 = ax0 + boxes_a[:, 2:3], ay0 + boxes_a[:, 3:4]
+    bx0, by0 = boxes_b[:, 0], boxes_b[:, 1]
+    bx1, by1 = bx0 + boxes_b[:, 2], by0 + boxes_b[:, 3]
+    w_inter = np.clip(np.minimum(ax1, bx1) - np.maximum(ax0, bx0), 0, None)
+    h_inter = np.clip(np.minimum(ay1, by1) - np.maximum(ay0, by0), 0, None)
+    return w_inter * h_inter
+
+
+def _ocr_provider_params():
+    """
+    RapidOCR flags that run det/cls/rec on a GPU execution provider when the
+    installed onnxruntime has one; RapidOCR otherwise stays on the CPU even
+    with CUDA or DirectML available.
+    """
+    available = onnxruntime.get_available_providers()
+    for provider, flag in (("CUDAExecutionProvider", "use_cuda"), ("DmlExecutionProvider", "use_dml")):
+        if provider in available:
+            return {f"{model}_{flag}": True for model in ("det", "cls", "rec")}
+    return {}
+
+
+# One RapidOCR engine per process: building it loads the det/cls/rec models
+# and their ONNX sessions, so every SlideReconstructor shares the first one
+_ocr_engine = None
+
+
+def _get_ocr_engine():
+    """The shared RapidOCR engine, created on first use."""
+    global _ocr_engine
+    if _ocr_engine is None:
+        _ocr_engine = RapidOCR(**_ocr_provider_params())
+    return _ocr_engine
+
 
 class SlideReconstructor:
     def __init__(self):
-        self.ocr = RapidOCR()
+        self.ocr = _get_ocr_engine()
+        # Crop and debug image writes run on a small thread pool (imwrite
+        # releases the GIL while encoding) so they overlap the next page; see flush()
+        self._io_pool = None
+        self._pending_writes = []
 
-    def process_image(self, image_path, output_dir=None):
+    def _write_image(self, path, image):
+        """Queue a cv2.imwrite on the I/O pool"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=4)
+        self._pending_writes.append((path, self._io_pool.submit(cv2.imwrite, path, image)))
+
+    def flush(self):
+        """Wait until every image queued by process_image is on disk"""
+        pending, self._pending_writes = self._pending_writes, []
+        for path, future in pending:
+            if not future.result():
+                print(f"Warning: could not write image {path}")
+
+    def close(self):
+        """Finish pending writes and stop the I/O pool"""
+        self.flush()
+        if self._io_pool is not None:
+            self._io_pool.shutdown()
+            self._io_pool = None
+
+    def process_image(self, image_path, output_dir=None, image=None):
         """
         Process an image to extract text paragraphs and separate image objects.
+        
+        image is the already decoded BGR page, e.g. straight from render_page;
+        when given, image_path only names the output files and the PNG is not
+        decoded again. It is read, never modified.
+        
+        Crops and the debug image are written in the background: their paths
+        are set on return, call flush() before reading the files.
         """
-        img = cv2.imread(str(image_path))
-        if img is None:
-            raise ValueError(f"Could not read image: {image_path}")
+        if image is not None:
+            img = image
+        else:
+            img = cv2.imread(str(image_path))
+            if img is None:
+                raise ValueError(f"Could not read image: {image_path}")
             
         if output_dir:
             output_dir = Path(output_dir)
@@ -23,91 +118,118 @@ class SlideReconstructor:
         ocr_result, _ = self.ocr(img)
         
         raw_text_blocks = []
+        text_rects = []
         mask_text = np.zeros(img.shape[:2], dtype=np.uint8)
         
         if ocr_result:
             for item in ocr_result:
                 box_points, text, score = item
+                pts = np.array(box_points, dtype=np.int32)
+                x, y, w, h = cv2.boundingRect(pts)
                 
                 # Filter unwanted text
-                if "NotebookLM" in text:
-                    pass 
-                else:
-                    pts = np.array(box_points, dtype=np.int32)
-                    x, y, w, h = cv2.boundingRect(pts)
+                if not self._is_watermark(text):
                     raw_text_blocks.append({
                         "text": text,
                         "box": [x, y, w, h],
                         "font_size": h 
                     })
                 
-                pts = np.array(box_points, dtype=np.int32)
-                cv2.fillPoly(mask_text, [pts], 255)
-                # Aggressive dilation for inpainting: Draw a padded rectangle
+                # Aggressive dilation for inpainting: a padded rectangle
                 # This ensures we fully cover the text pixels to prevent 'ghosting'
-                x, y, w, h = cv2.boundingRect(pts)
+                # (it contains the text quad, so the quad itself needs no fill)
                 pad = 10 
-                cv2.rectangle(mask_text, (max(0, x-pad), max(0, y-pad)), 
-                              (min(img.shape[1], x+w+pad), min(img.shape[0], y+h+pad)), 255, -1)
+                text_rects.append((x - pad, y - pad, x + w + pad, y + h + pad))
         
-        # Dilate text mask
-        kernel_text = np.ones((7,7), np.uint8)
-        mask_text = cv2.dilate(mask_text, kernel_text, iterations=3)
+        # Dilated text mask
+        fill_rects(mask_text, grow_rects(text_rects, _GROW_TEXT, mask_text.shape))
 
         # 2. Detect & Extract Image Objects
+        # Threshold and text removal run in place: gray and binary are not
+        # needed afterwards, so the page-sized map is allocated only once
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        _, binary = cv2.threshold(gray, 240, 255, cv2.THRESH_BINARY_INV)
-        
-        # Remove text
-        binary_no_text = cv2.bitwise_and(binary, binary, mask=cv2.bitwise_not(mask_text))
+        _, binary = cv2.threshold(gray, 240, 255, cv2.THRESH_BINARY_INV, dst=gray)
         
-        # Dilate to connect loose parts of diagrams
-        # Removed erosion - was too aggressive and broke some elements
-        kernel_img = np.ones((5,5), np.uint8)
-        dilated_img_map = cv2.dilate(binary_no_text, kernel_img, iterations=2)
-        
-        contours, _ = cv2.findContours(dilated_img_map, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        if not text_rects and cv2.countNonZero(binary) < BLANK_PAGE_INK_RATIO * binary.size:
+            # Nearly blank page without text: no diagram to find, skip the search
+            boxes = np.empty((0, 4), dtype=np.int64)
+        else:
+            # Remove text (both masks are 0/255, so a saturating subtract is
+            # binary AND NOT text in one pass, without an inverted mask copy)
+            binary_no_text = cv2.subtract(binary, mask_text, dst=binary)
+            
+            # Dilate to connect loose parts of diagrams
+            # Removed erosion - was too aggressive and broke some elements
+            dilated_img_map = cv2.dilate(binary_no_text, _KERNEL_IMG)
+            
+            # Bounding boxes of the blobs in one connected-components pass, run only
+            # inside the bounding box of the remaining ink
+            roi_x, roi_y, roi_w, roi_h = cv2.boundingRect(dilated_img_map)
+            if roi_w and roi_h:
+                _, _, stats, _ = cv2.connectedComponentsWithStats(
+                    dilated_img_map[roi_y:roi_y+roi_h, roi_x:roi_x+roi_w], connectivity=8
+                )
+                # Drop the background label and reverse, so blobs come bottom-up in
+                # the order findContours used to return them (ids and z-order)
+                boxes = stats[:0:-1, :4].astype(np.int64)
+                boxes[:, 0] += roi_x
+                boxes[:, 1] += roi_y
+            else:
+                boxes = np.empty((0, 4), dtype=np.int64)
         
         image_objects = []
-        mask_images = np.zeros(img.shape[:2], dtype=np.uint8)
+        image_rects = []
         
         full_h, full_w = img.shape[:2]
         
-        for idx, cnt in enumerate(contours):
-            x, y, w, h = cv2.boundingRect(cnt)
-            area = w * h
+        # Heuristics, on all blobs at once
+        bw, bh = boxes[:, 2], boxes[:, 3]
+        keep = (bw > 30) & (bh > 30) & (bw * bh > 1000)
+        keep &= ~((bw > 0.9 * full_w) & (bh > 0.9 * full_h))  # Likely full page border
+        kept_ids = np.flatnonzero(keep)
+        
+        # Blobs sitting inside another diagram's box are already part of its
+        # crop (findContours' RETR_EXTERNAL skipped blobs in holes likewise)
+        if len(kept_ids) > 1:
+            kx0, ky0 = boxes[kept_ids, 0], boxes[kept_ids, 1]
+            kx1, ky1 = kx0 + boxes[kept_ids, 2], ky0 + boxes[kept_ids, 3]
+            inside = ((kx0[:, None] >= kx0) & (ky0[:, None] >= ky0) &
+                      (kx1[:, None] <= kx1) & (ky1[:, None] <= ky1))
+            same = ((kx0[:, None] == kx0) & (ky0[:, None] == ky0) &
+                    (kx1[:, None] == kx1) & (ky1[:, None] == ky1))
+            kept_ids = kept_ids[~(inside & ~same).any(axis=1)]
+        
+        for idx in kept_ids.tolist():
+            x, y, w, h = boxes[idx].tolist()
             
-            # Heuristics
-            if w > 30 and h > 30 and area > 1000:
-                if w > 0.9 * full_w and h > 0.9 * full_h:
-                    continue
-                    
-                # Extract crop with Padding (Safe improvement)
-                pad = 10
-                x_p = max(0, x - pad)
-                y_p = max(0, y - pad)
-                w_p = min(full_w - x_p, w + 2*pad)
-                h_p = min(full_h - y_p, h + 2*pad)
-                
-                crop = img[y_p:y_p+h_p, x_p:x_p+w_p]
-                
-                img_obj = {
-                    "path": "", 
-                    "box": [x_p, y_p, w_p, h_p],
-                    "crop": crop,
-                    "id": idx
-                }
-                image_objects.append(img_obj)
-                
-                cv2.rectangle(mask_images, (x_p, y_p), (x_p+w_p, y_p+h_p), 255, -1)
+            # Extract crop with Padding (Safe improvement)
+            pad = 10
+            x_p = max(0, x - pad)
+            y_p = max(0, y - pad)
+            w_p = min(full_w - x_p, w + 2*pad)
+            h_p = min(full_h - y_p, h + 2*pad)
+            
+            crop = img[y_p:y_p+h_p, x_p:x_p+w_p]
+            
+            img_obj = {
+                "path": "", 
+                "box": [x_p, y_p, w_p, h_p],
+                "crop": crop,
+                "id": idx
+            }
+            image_objects.append(img_obj)
+            image_rects.append((x_p, y_p, x_p+w_p, y_p+h_p))
 
         # 3. Create Clean Background
-        full_mask = cv2.bitwise_or(mask_text, mask_images)
-        kernel_text_bg = np.ones((7,7), np.uint8)
-        full_mask = cv2.dilate(full_mask, kernel_text_bg, iterations=2)
-        
-        # Inpaint
-        clean_image = cv2.inpaint(img, full_mask, 3, cv2.INPAINT_NS)
+        if not (text_rects or image_rects):
+            # Nothing to mask out, so nothing to inpaint (and no crops share img)
+            clean_image = img
+        else:
+            # Text and image boxes, dilated (text boxes by both of their dilations)
+            full_mask = np.zeros(img.shape[:2], dtype=np.uint8)
+            fill_rects(full_mask, grow_rects(text_rects, _GROW_TEXT + _GROW_TEXT_BG, full_mask.shape))
+            fill_rects(full_mask, grow_rects(image_rects, _GROW_TEXT_BG, full_mask.shape))
+            clean_image = fill_background(img, full_mask)
         
         # 4. Group Text into Paragraphs
         grouped_blocks = self.group_text_blocks(raw_text_blocks)
@@ -115,37 +237,29 @@ class SlideReconstructor:
         # 5. Overlap Detection
         # If text overlaps an image by 50%+, discard it - the image shows that text
         # 50% is a balance: catches true overlaps, preserves edge text
-        final_text_blocks = []
+        # All text x image pairs are compared at once
         overlap_threshold = 0.5
         
-        for block in grouped_blocks:
-            bx, by, bw, bh = block['box']
-            
-            is_inside_image = False
-            for img_obj in image_objects:
-                ix, iy, iw, ih = img_obj['box']
-                
-                # Calculate intersection area
-                x_overlap = max(0, min(bx + bw, ix + iw) - max(bx, ix))
-                y_overlap = max(0, min(by + bh, iy + ih) - max(by, iy))
-                overlap_area = x_overlap * y_overlap
-                text_area = bw * bh
-                
-                # Check if text is mostly (70%+) inside the image
-                if text_area > 0 and (overlap_area / text_area) > overlap_threshold:
-                    is_inside_image = True
-                    break
+        if grouped_blocks and image_objects:
+            tb = np.array([b['box'] for b in grouped_blocks], dtype=np.int64)
+            ib = np.array([o['box'] for o in image_objects], dtype=np.int64)
+            overlap_area = _intersection_areas(tb, ib)
+            text_area = tb[:, 2] * tb[:, 3]
             
-            if not is_inside_image:
-                final_text_blocks.append(block)
+            # Text mostly inside any image (overlap / text_area > threshold)
+            is_inside_image = (text_area > 0) & (
+                overlap_area > overlap_threshold * text_area[:, None]).any(axis=1)
+            final_text_blocks = [b for b, inside in zip(grouped_blocks, is_inside_image) if not inside]
+        else:
+            final_text_blocks = list(grouped_blocks)
                 
-        # Save image objects
+        # Save image objects (crops are views of img, so leave it as is)
         if output_dir:
             for img_obj in image_objects:
                 img_filename = f"{Path(image_path).stem}_img_{img_obj['id']}.png"
                 img_path = output_dir / img_filename
-                cv2.imwrite(str(img_path), img_obj['crop'])
                 img_obj['path'] = str(img_path)
+                self._write_image(img_obj['path'], img_obj['crop'])
 
         # 6. Debug Visualization
         if output_dir:
@@ -161,7 +275,7 @@ class SlideReconstructor:
                 cv2.rectangle(debug_img, (x, y), (x+w, y+h), (0, 255, 0), 2)
                 
             debug_path = output_dir / f"{Path(image_path).stem}_debug.jpg"
-            cv2.imwrite(str(debug_path), debug_img)
+            self._write_image(str(debug_path), debug_img)
         
         return {
             "text_blocks": final_text_blocks,
@@ -181,51 +295,58 @@ class SlideReconstructor:
         # Group logic relies on reading order (top-down, left-right)
         blocks.sort(key=lambda b: (b['box'][1], b['box'][0]))
         
-        merged_blocks = []
+        # Sweep down the page keeping every paragraph that can still grow
+        # open, so lines from side-by-side columns (which interleave in Y)
+        # each continue their own paragraph. An open paragraph is
+        # [first_block, left, top, right, bottom, text_parts, order].
+        open_paras = []
+        closed_paras = []
         
-        if not blocks:
-            return []
-            
-        current_block = blocks[0]
-        
-        for next_block in blocks[1:]:
-            # Check criteria to merge 'next_block' into 'current_block'
+        for order, block in enumerate(blocks):
+            next_left, next_top, next_w, next_h = block['box']
             
-            # 1. Vertical Proximity
-            # Distance between bottom of current and top of next
-            curr_bottom = current_block['box'][1] + current_block['box'][3]
-            next_top = next_block['box'][1]
-            vertical_dist = next_top - curr_bottom
-            
-            # STRICT: Only 0.3x line height (was 0.8x - too aggressive)
-            # This prevents separate bullet points and slide elements from merging
-            line_height = current_block['box'][3]
-            if vertical_dist < line_height * 0.3 and vertical_dist >= -5:
+            target = None
+            still_open = []
+            for para in open_paras:
+                _, left, top, right, bottom, _, _ = para
                 
-                # 2. Horizontal Alignment (must be well-aligned)
-                h_diff = abs(current_block['box'][0] - next_block['box'][0])
-                if h_diff < 30: # Reduced from 50px - stricter alignment
-                    
-                    # MERGE
-                    # Update text: join with space
-                    current_block['text'] += " " + next_block['text']
-                    
-                    # Update box: union of both boxes
-                    x1 = min(current_block['box'][0], next_block['box'][0])
-                    y1 = min(current_block['box'][1], next_block['box'][1])
-                    x2 = max(current_block['box'][0] + current_block['box'][2], 
-                             next_block['box'][0] + next_block['box'][2])
-                    y2 = max(current_block['box'][1] + current_block['box'][3], 
-                             next_block['box'][1] + next_block['box'][3])
-                    
-                    current_block['box'] = [x1, y1, x2-x1, y2-y1]
+                # 1. Vertical Proximity
+                # Distance between bottom of the paragraph and top of next
+                vertical_dist = next_top - bottom
+                
+                # STRICT: Only 0.3x line height (was 0.8x - too aggressive)
+                # This prevents separate bullet points and slide elements from merging
+                line_height = bottom - top
+                if vertical_dist >= line_height * 0.3:
+                    # Blocks are sorted by top, so nothing later can reach it
+                    closed_paras.append(para)
                     continue
+                still_open.append(para)
+                
+                # 2. Horizontal Alignment (must be well-aligned)
+                h_diff = abs(left - next_left)
+                if vertical_dist >= -5 and h_diff < 30: # Reduced from 50px - stricter alignment
+                    if target is None or h_diff < abs(target[1] - next_left):
+                        target = para
+            open_paras = still_open
             
-            # If not merged, push current and start new
-            merged_blocks.append(current_block)
-            current_block = next_block
-            
-        merged_blocks.append(current_block)
+            if target is not None:
+                # MERGE
+                # Text is joined with spaces, box becomes the union of both
+                target[5].append(block['text'])
+                target[1], target[2] = min(target[1], next_left), min(target[2], next_top)
+                target[3] = max(target[3], next_left + next_w)
+                target[4] = max(target[4], next_top + next_h)
+            else:
+                open_paras.append([block, next_left, next_top, next_left + next_w,
+                                   next_top + next_h, [block['text']], order])
+        
+        # Emit paragraphs in the reading order of their first line
+        merged_blocks = []
+        for block, left, top, right, bottom, parts, _ in sorted(closed_paras + open_paras, key=lambda p: p[6]):
+            block['text'] = " ".join(parts)
+            block['box'] = [left, top, right - left, bottom - top]
+            merged_blocks.append(block)
         
         # Post-process: fix common OCR issues
         for block in merged_blocks:
@@ -236,22 +357,25 @@ class SlideReconstructor:
         
         return merged_blocks
     
+    def _is_watermark(self, text):
+        """True if text matches one of the known NotebookLM watermark patterns."""
+        return bool(_WATERMARK_RE and _WATERMARK_RE.search(text))
+
     def _fix_ocr_text(self, text):
         """Fix common OCR spacing and character errors."""
-        import re
         if not text:
             return text
         
         # Add space before capitals in middle of words (CamelCase from merged words)
         # e.g. "TheStrategic" -> "The Strategic"
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+        text = _CAMEL_RE.sub(r'\1 \2', text)
         
         # Add space after punctuation if followed by a letter
         # e.g. "Hello,world" -> "Hello, world"
-        text = re.sub(r'([,;:])([A-Za-z])', r'\1 \2', text)
+        text = _PUNCT_RE.sub(r'\1 \2', text)
         
         # Add space after period if followed by uppercase
-        text = re.sub(r'\.([A-Z])', r'. \1', text)
+        text = _PERIOD_RE.sub(r'. \1', text)
         
         # Fix lowercase-lowercase merges (aggressive but needed for "neutraladvice")
         # Finds 3+ letter words merged: [a-z]{3,}[a-z]{3,}
@@ -259,10 +383,10 @@ class SlideReconstructor:
         # e.g. "neutraladvice" -> "neutral advice"
         
         # Clean up double spaces
-        text = re.sub(r'  +', ' ', text)
+        text = _SPACES_RE.sub(' ', text)
         
         # Add space around 'vs' if stuck (e.g. differsvsweights -> differs vs weights)
-        text = re.sub(r'(\w)vs(\w)', r'\1 vs \2', text)
+        text = _VS_RE.sub(r'\1 vs \2', text)
         
         # Add space around 'and' if stuck (risky, but safe for 'routinesandoutcome')
         # Limiting to at least 3 chars before/after to avoid 'band', 'sand' issues inside words? 
@@ -283,51 +407,24 @@ class SlideReconstructor:
         # Assuming we want to keep the one that encompasses the other
         blocks.sort(key=lambda b: b['box'][2] * b['box'][3], reverse=True)
         
-        filtered = []
-        indices_to_remove = set()
+        # Pairwise intersections, all at once
+        boxes = np.array([b['box'] for b in blocks], dtype=np.int64)
+        areas = boxes[:, 2] * boxes[:, 3]
+        inter_area = _intersection_areas(boxes, boxes)
         
-        for i in range(len(blocks)):
-            if i in indices_to_remove:
-                continue
-                
-            b1 = blocks[i]
-            x1, y1, w1, h1 = b1['box']
-            area1 = w1 * h1
-            
-            for j in range(i + 1, len(blocks)):
-                if j in indices_to_remove:
-                    continue
-                    
-                b2 = blocks[j]
-                x2, y2, w2, h2 = b2['box']
-                area2 = w2 * h2
-                
-                # Calculate intersection
-                xx1 = max(x1, x2)
-                yy1 = max(y1, y2)
-                xx2 = min(x1 + w1, x2 + w2)
-                yy2 = min(y1 + h1, y2 + h2)
-                
-                w_inter = max(0, xx2 - xx1)
-                h_inter = max(0, yy2 - yy1)
-                inter_area = w_inter * h_inter
-                
-                if inter_area > 0:
-                    # Check intersection against smaller block area
-                    smaller_area = min(area1, area2)
-                    if smaller_area > 0 and (inter_area / smaller_area) > threshold:
-                        # Significant overlap! Remove the smaller one
-                        if area1 < area2:
-                            indices_to_remove.add(i)
-                            break # b1 is removed, stop checking b1 against others
-                        else:
-                            indices_to_remove.add(j)
+        # Check intersection against smaller block area
+        smaller_area = np.minimum(areas[:, None], areas)
+        overlaps = (inter_area > 0) & (smaller_area > 0) & \
+            (inter_area / np.maximum(smaller_area, 1) > threshold)
         
+        # Significant overlap! Larger blocks come first, so each kept block
+        # removes the smaller ones after it
+        removed = np.zeros(len(blocks), dtype=bool)
         for i in range(len(blocks)):
-            if i not in indices_to_remove:
-                filtered.append(blocks[i])
-                
-        return filtered
+            if not removed[i]:
+                removed[i + 1:] |= overlaps[i, i + 1:]
+        
+        return [b for b, r in zip(blocks, removed) if not r]
 
 if __name__ == "__main__":
     pass
@@ -1,9 +1,45 @@
 import fitz  # PyMuPDF
+import cv2
+import numpy as np
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from .utils.image_inpainter import inpaint_image
+from .config import MAX_CONCURRENT_PAGES
 
-def pdf_to_png(pdf_path, output_dir=None, dpi=150,inpaint=False):
+# Documents opened by _render_png_worker, one per PDF path in each worker process
+_worker_docs = {}
+
+def render_page(page, dpi=150):
+    """
+    Render a PDF page straight to a BGR numpy array, skipping the PNG round trip
+    
+    Args:
+        page: fitz.Page to render
+        dpi: Resolution, default 150
+    """
+    zoom = dpi / 72
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+    # Same pixels pdf_to_png saves, in the channel order cv2.imread returns
+    return cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+
+def _save_png(page, mat, output_path, inpaint):
+    """Render one page to output_path, then inpaint the file in place if asked"""
+    pix = page.get_pixmap(matrix=mat, alpha=False)
+    pix.save(output_path)
+    if inpaint:
+        from .utils.image_inpainter import inpaint_image
+        inpaint_image(str(output_path), str(output_path))
+
+def _render_png_worker(pdf_path, page_index, dpi, output_path, inpaint):
+    """Module-level so ProcessPoolExecutor can pickle it; the PDF is opened once per worker"""
+    doc = _worker_docs.get(pdf_path)
+    if doc is None:
+        doc = _worker_docs[pdf_path] = fitz.open(pdf_path)
+    zoom = dpi / 72
+    _save_png(doc.load_page(page_index), fitz.Matrix(zoom, zoom), output_path, inpaint)
+
+def pdf_to_png(pdf_path, output_dir=None, dpi=150,inpaint=False, on_page=None):
     """
     Convert a PDF file to multiple PNG images
     
@@ -11,6 +47,11 @@ def pdf_to_png(pdf_path, output_dir=None, dpi=150,inpaint=False):
         pdf_path: Path to the PDF file
         output_dir: Output directory, defaults to pdf_name_pngs folder in the same directory as the PDF
         dpi: Resolution, default 150
+        on_page: Optional callback called with each page's PNG path (including
+            skipped existing ones) as soon as that page is ready, in page order
+    
+    Pages are rendered (and inpainted) in parallel worker processes when more
+    than one needs it; their paths are still reported in page order.
     """
     # Open the PDF file
     pdf_doc = fitz.open(pdf_path)
@@ -29,25 +70,48 @@ def pdf_to_png(pdf_path, output_dir=None, dpi=150,inpaint=False):
     zoom = dpi / 72
     mat = fitz.Matrix(zoom, zoom)
     
-    # Iterate through each page
-    page_count = len(pdf_doc)  # Get page count before closing the document
-    for page_num, page in enumerate(pdf_doc, 1):
-        # Render page as image
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        
-        # Save as PNG
-        output_path = output_dir / f"page_{page_num:04d}.png"
-
-        if os.path.exists(output_path):
-            print(f"Skipping existing file: {output_path}")
-            continue
-        pix.save(output_path)
-        print(f"✓ Saved: {output_path}")
-        if inpaint:
-            inpaint_image(str(output_path), str(output_path))
-            print(f"✓ Inpainted: {output_path}")
+    page_count = pdf_doc.page_count  # Get page count before closing the document
+    output_paths = [output_dir / f"page_{page_num:04d}.png" for page_num in range(1, page_count + 1)]
+    
+    # Check before loading/rendering so existing pages cost nothing
+    missing = [i for i, output_path in enumerate(output_paths) if not os.path.exists(output_path)]
+    
+    # Several pages to render: hand them all to worker processes up front
+    pool = None
+    futures = {}
+    if len(missing) > 1:
+        pool = ProcessPoolExecutor(max_workers=min(MAX_CONCURRENT_PAGES, len(missing)))
+        futures = {
+            i: pool.submit(_render_png_worker, str(pdf_path), i, dpi, str(output_paths[i]), inpaint)
+            for i in missing
+        }
+    
+    try:
+        # Iterate through each page
+        for i, output_path in enumerate(output_paths):
+            if i in futures:
+                futures.pop(i).result()
+            elif i in missing:
+                # Render page as image (single page: no pool to start)
+                _save_png(pdf_doc.load_page(i), mat, output_path, inpaint)
+            else:
+                print(f"Skipping existing file: {output_path}")
+                if on_page:
+                    on_page(output_path)
+                continue
             
-    pdf_doc.close()
+            print(f"✓ Saved: {output_path}")
+            if inpaint:
+                print(f"✓ Inpainted: {output_path}")
+            if on_page:
+                on_page(output_path)
+    finally:
+        if pool is not None:
+            # On error, drop the pages no worker has started yet
+            for future in futures.values():
+                future.cancel()
+            pool.shutdown()
+        pdf_doc.close()
     print(f"\nDone! Converted {page_count} pages, output directory: {output_dir}")
 
 if __name__ == "__main__":
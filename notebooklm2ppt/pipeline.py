@@ -0,0 +1,151 @@
+"""
+Conversion steps shared by the CLI and the GUI: page rendering and
+extraction pipelines, background JPEG writing and opening the result.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from .config import MAX_CONCURRENT_PAGES, JPEG_QUALITY
+
+
+def open_result(path):
+    """Open the finished presentation with the platform's default application"""
+    path = os.fspath(os.path.abspath(path))
+    try:
+        if sys.platform == "win32":
+            os.startfile(path)
+        elif sys.platform == "darwin":
+            subprocess.Popen(["open", path])
+        else:
+            subprocess.Popen(["xdg-open", path])
+    except OSError as e:
+        print(f"Could not open {path}: {e}")
+
+
+def open_result_async(path):
+    """
+    Launch the viewer off the main thread so the final messages are not held up
+    
+    Not a daemon thread: interpreter shutdown would otherwise kill it before
+    the viewer had been launched.
+    """
+    threading.Thread(target=open_result, args=(path,), name="open_result").start()
+
+
+def _process_one(pdf_path, page_num, dpi, png_dir, debug=False):
+    """
+    Render and extract a single page in a worker process.
+    
+    Kept at module level so ProcessPoolExecutor can pickle it. The page is
+    rendered straight to an array, so no page PNG is encoded or decoded.
+    Crops are dropped before returning since they were already saved to png_dir.
+    """
+    from .direct_extractor import get_worker_extractor
+    
+    extractor = get_worker_extractor()
+    # Direct Extraction (uses PDF for text, Image for bg). With no image
+    # given, the page is rendered in memory from the worker's cached document
+    slide_data = extractor.process_page(
+        pdf_path=pdf_path,
+        output_dir=png_dir,
+        page_num=page_num,
+        dpi=dpi,
+        debug=debug
+    )
+    for img_obj in slide_data["image_objects"]:
+        img_obj.pop("crop", None)
+    # Crop files must be complete before the main process builds the slide
+    extractor.flush()
+    return slide_data
+
+
+def jpeg_params():
+    """cv2 JPEG encoder params for slide backgrounds: JPEG_QUALITY, baseline single-pass Huffman (no optimize/progressive passes)"""
+    import cv2
+    
+    return [
+        int(cv2.IMWRITE_JPEG_QUALITY), JPEG_QUALITY,
+        int(cv2.IMWRITE_JPEG_OPTIMIZE), 0,
+        int(cv2.IMWRITE_JPEG_PROGRESSIVE), 0,
+    ]
+
+
+def write_jpeg(path, image, params):
+    """
+    Encode image as JPEG in memory and write the bytes to path.
+    
+    Unlike cv2.imwrite this goes through Python's file I/O, so non-ASCII paths
+    work on Windows and a failed write raises instead of returning False.
+    """
+    import cv2
+    
+    ok, buf = cv2.imencode(".jpg", image, params)
+    if not ok:
+        raise ValueError(f"Could not encode image: {path}")
+    with open(path, "wb") as f:
+        f.write(buf)
+
+
+def extract_pages(pdf_path, page_count, dpi, png_dir, debug=False):
+    """
+    Extract every page in worker processes and save the clean backgrounds.
+    
+    Pages are independent, so they are extracted in parallel; slides are added
+    in page order by the caller once the pool has drained. JPEG encoding of
+    the clean backgrounds runs on a small thread pool (cv2 releases the GIL)
+    so it overlaps with the remaining extraction.
+    
+    Returns {page_index: (slide_data, clean_bg_path, write_future)}; pages
+    that failed are reported and left out. The full-size clean_image is handed
+    to its write job and not kept in slide_data, so a deck's backgrounds are
+    never all held in memory at once; slide_data["image_size"], set by the
+    extractor from the rendered page, has its (width, height) instead.
+    """
+    page_names = [f"page_{idx + 1:04d}" for idx in range(page_count)]
+    params = jpeg_params()
+    results = {}
+    with ProcessPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as executor, \
+            ThreadPoolExecutor(max_workers=2) as io_pool:
+        futures = {
+            executor.submit(_process_one, pdf_path, idx, dpi, png_dir, debug): idx
+            for idx in range(page_count)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            idx = futures[future]
+            page_name = page_names[idx]
+            try:
+                slide_data = future.result()
+                
+                # Save clean background for PPT; once written, the write
+                # job's reference is the last one and the array is freed
+                clean_image = slide_data.pop("clean_image")
+                clean_bg_path = png_dir / f"{page_name}_clean.jpg"
+                write_future = io_pool.submit(write_jpeg, clean_bg_path, clean_image, params)
+                del clean_image
+                results[idx] = (slide_data, clean_bg_path, write_future)
+                print(f"[{done}/{page_count}] Processed {page_name}")
+            except Exception as e:
+                print(f"Error processing page {idx}: {e}")
+                import traceback
+                traceback.print_exc()
+    return results
+
+
+def render_pages(pdf_path, png_dir, dpi, inpaint, pages):
+    """
+    Producer for process_pdf_to_ppt: queue each page PNG as soon as it is
+    rendered, then a None sentinel. If rendering fails, the exception is
+    queued in place of the sentinel so the consumer can re-raise it.
+    """
+    from .pdf2png import pdf_to_png
+    
+    error = None
+    try:
+        pdf_to_png(pdf_path, png_dir, dpi=dpi, inpaint=inpaint, on_page=pages.put)
+    except Exception as e:
+        error = e
+    finally:
+        pages.put(error)
@@ -1,8 +1,5 @@
 """Utility functions module"""
 
-from .image_viewer import show_image_fullscreen
-from .image_inpainter import inpaint_image, remove_watermark, remove_watermark_cv2
-from .screenshot_automation import take_fullscreen_snip, mouse, screen_height, screen_width
 from .coordinates import (
     pdf_to_pptx_coordinates,
     pixels_to_pptx_coordinates,
@@ -12,11 +9,41 @@ from .coordinates import (
     point_in_bbox,
 )
 
+# OpenCV, scikit-image and the Windows automation stack are only imported
+# when one of their names is first used (PEP 562)
+_LAZY_IMPORTS = {
+    'show_image_fullscreen': '.image_viewer',
+    'inpaint_image': '.image_inpainter',
+    'remove_watermark': '.image_inpainter',
+    'remove_watermark_cv2': '.image_inpainter',
+    'fill_background': '.masks',
+    'fill_rects': '.masks',
+    'grow_rects': '.masks',
+    'take_fullscreen_snip': '.screenshot_automation',
+    'mouse': '.screenshot_automation',
+    'screen_height': '.screenshot_automation',
+    'screen_width': '.screenshot_automation',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'show_image_fullscreen',
     'inpaint_image',
     'remove_watermark',
     'remove_watermark_cv2',
+    'fill_background',
+    'fill_rects',
+    'grow_rects',
     'take_fullscreen_snip',
     'mouse',
     'screen_height',
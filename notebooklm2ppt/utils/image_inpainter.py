@@ -23,6 +23,11 @@ DEFAULT_WATERMARK_REGION = {
     "relative_height": 0.041,
 }
 
+# Context kept around the watermark when inpainting. The biharmonic solve only
+# reads pixels within 2px of the mask, so a small window gives the same result
+# as solving on the whole page.
+_INPAINT_MARGIN = 8
+
 
 def get_watermark_region(
     image_width: int,
@@ -87,15 +92,22 @@ def remove_watermark(
         # Get watermark region
         r1, r2, c1, c2 = get_watermark_region(width, height, region_config)
         
+        # Inpaint only a window around the watermark, not the whole page
+        wr1, wr2 = max(0, r1 - _INPAINT_MARGIN), min(height, r2 + _INPAINT_MARGIN)
+        wc1, wc2 = max(0, c1 - _INPAINT_MARGIN), min(width, c2 + _INPAINT_MARGIN)
+        window = image_array[wr1:wr2, wc1:wc2]
+        
         # Create mask
-        mask = np.zeros(image_array.shape[:-1], dtype=bool)
-        mask[r1:r2, c1:c2] = True
+        mask = np.zeros(window.shape[:-1], dtype=bool)
+        mask[r1 - wr1:r2 - wr1, c1 - wc1:c2 - wc1] = True
         
-        # Apply biharmonic inpainting
-        result = inpaint.inpaint_biharmonic(image_array, mask, channel_axis=-1)
+        # Apply biharmonic inpainting, writing back only the masked pixels
+        # (rounded, so values like 254.9999 do not truncate to 254)
+        result = inpaint.inpaint_biharmonic(window, mask, channel_axis=-1)
+        window[mask] = np.rint(result[mask] * 255).astype("uint8")
         
         # Save result
-        Image.fromarray((result * 255).astype("uint8")).save(output_path)
+        Image.fromarray(image_array).save(output_path)
         
         return True
         
@@ -130,8 +142,9 @@ def remove_watermark_cv2(
     mask = np.zeros((height, width), dtype=np.uint8)
     mask[r1:r2, c1:c2] = 255
     
-    # Apply Navier-Stokes inpainting (fast, good quality)
-    result = cv2.inpaint(image, mask, inpaintRadius=5, flags=cv2.INPAINT_NS)
+    # Apply Navier-Stokes inpainting (fast, good quality; TELEA measured
+    # slower here). Radius 3 like the other call sites: the band is small
+    result = cv2.inpaint(image, mask, inpaintRadius=3, flags=cv2.INPAINT_NS)
     
     return result
 
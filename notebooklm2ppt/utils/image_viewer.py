@@ -31,6 +31,9 @@ def show_image_fullscreen(image_path: str, display_height: int = None):
     Args:
         image_path: Path to the image
         display_height: Specified display height (pixels), if None it will auto-fit to screen
+    
+    Returns:
+        Name of the OpenCV window showing the image
     """
     if not os.path.exists(image_path):
         raise FileNotFoundError(f"Image not found: {image_path}")
@@ -91,6 +94,8 @@ def show_image_fullscreen(image_path: str, display_height: int = None):
     except Exception:
         pass
 
+    return win_name
+
     # # Press any key or ESC to exit
     # key = cv2.waitKey(0)
     # if key == 27:  # ESC
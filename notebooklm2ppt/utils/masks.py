@@ -0,0 +1,92 @@
+"""
+Mask helpers shared by the direct (PDF text layer) and OCR extractors.
+
+Text and object masks are unions of axis-aligned boxes, so they are painted
+and dilated box by box instead of with page-sized OpenCV passes, and the
+masked area is then filled from the page background.
+"""
+
+import cv2
+import numpy as np
+
+from ..config import INPAINT_FAST_FILL_COVERAGE, INPAINT_FAST_FILL_SCALE
+
+
+# A masked page counts as a flat background when this fraction of the
+# unmasked pixels lies within this many levels (per channel) of their median
+_FLAT_BG_TOLERANCE = 12
+_FLAT_BG_RATIO = 0.9
+# Unmasked pixels sampled for the background colour
+_BG_SAMPLE_SIZE = 100_000
+
+
+def fill_rects(mask: np.ndarray, rects) -> None:
+    """
+    Fill axis-aligned boxes on a uint8 mask with plain slice stores.
+
+    Corners are inclusive and clipped to the mask, matching
+    cv2.rectangle(mask, (x0, y0), (x1, y1), 255, -1) without a cv2 call per box.
+    """
+    mask_h, mask_w = mask.shape[:2]
+    for x0, y0, x1, y1 in rects:
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(mask_w - 1, x1), min(mask_h - 1, y1)
+        if x0 <= x1 and y0 <= y1:
+            mask[y0:y1 + 1, x0:x1 + 1] = 255
+
+
+def grow_rects(rects, radius: int, mask_shape) -> list:
+    """
+    Boxes grown by radius on every side, for fill_rects.
+
+    Filling these equals cv2.dilate of the original boxes' mask with a
+    (2 * radius + 1) square rect, without a pass over the whole mask. Boxes
+    entirely off the mask fill nothing to dilate, so they are dropped.
+    """
+    mask_h, mask_w = mask_shape[:2]
+    return [(x0 - radius, y0 - radius, x1 + radius, y1 + radius)
+            for x0, y0, x1, y1 in rects
+            if max(0, x0) <= min(mask_w - 1, x1) and max(0, y0) <= min(mask_h - 1, y1)]
+
+
+def fill_background(image: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Copy of a BGR image with the mask's non-zero pixels replaced by background.
+
+    Lightly masked pages are inpainted (Navier-Stokes). Inpainting cost grows
+    with the masked area, so above INPAINT_FAST_FILL_COVERAGE the fill is
+    built from the unmasked pixels only: their median colour when the slide
+    background is flat, otherwise an inpaint of the page downscaled by
+    INPAINT_FAST_FILL_SCALE.
+    """
+    masked = cv2.countNonZero(mask)
+    if masked <= INPAINT_FAST_FILL_COVERAGE * mask.size:
+        return cv2.inpaint(image, mask, 3, cv2.INPAINT_NS)
+
+    clean = image.copy()
+    hole = mask > 0
+    visible = image[~hole]
+    if not len(visible):
+        # Nothing left to estimate a background from
+        clean[hole] = 255
+        return clean
+
+    sample = visible[::max(1, len(visible) // _BG_SAMPLE_SIZE)]
+    colour = np.median(sample, axis=0)
+    near = (np.abs(sample - colour) <= _FLAT_BG_TOLERANCE).all(axis=1)
+    if near.mean() >= _FLAT_BG_RATIO:
+        clean[hole] = np.rint(colour).astype(np.uint8)
+        return clean
+
+    # Textured or gradient background: inpaint at a reduced size. A small
+    # pixel counts as masked if any pixel it covers is, so the content under
+    # the mask cannot leak into the fill.
+    img_h, img_w = mask.shape[:2]
+    small_size = (max(1, img_w // INPAINT_FAST_FILL_SCALE), max(1, img_h // INPAINT_FAST_FILL_SCALE))
+    small = cv2.resize(image, small_size, interpolation=cv2.INTER_AREA)
+    small_mask = cv2.resize(mask, small_size, interpolation=cv2.INTER_AREA)
+    _, small_mask = cv2.threshold(small_mask, 0, 255, cv2.THRESH_BINARY, dst=small_mask)
+    small = cv2.inpaint(small, small_mask, 3, cv2.INPAINT_NS)
+    fill = cv2.resize(small, (img_w, img_h), interpolation=cv2.INTER_LINEAR)
+    clean[hole] = fill[hole]
+    return clean
@@ -24,6 +24,15 @@ screen_width = win32api.GetSystemMetrics(0)
 screen_height = win32api.GetSystemMetrics(1)
 
 
+def screen_size():
+    """Primary screen size in physical pixels, after making the process DPI aware"""
+    import ctypes
+    user32 = ctypes.windll.user32
+    # Without DPI awareness, scaled displays report DPI-virtualized sizes
+    user32.SetProcessDPIAware()
+    return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+
+
 def get_ppt_windows():
     """Get the list of all current PowerPoint window handles"""
     ppt_windows = []
@@ -1,8 +1,10 @@
 import cv2
-import numpy as np
 import os
 from pathlib import Path
 
+# 5x5 dilation with iterations=2, as one 9x9 pass; built once
+_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (9, 9))
+
 def detect_regions(image_path):
     print(f"Analyzing: {image_path}")
     img = cv2.imread(str(image_path))
@@ -20,8 +22,7 @@ def detect_regions(image_path):
     # Images/Boxes are large.
     
     # Dilate to connect nearby components
-    kernel = np.ones((5,5), np.uint8)
-    dilated = cv2.dilate(binary, kernel, iterations=2)
+    dilated = cv2.dilate(binary, _KERNEL)
     
     # Find contours
     contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -0,0 +1,22 @@
+"""
+Page drawings shared by the extractor tests.
+"""
+
+import fitz
+
+
+def draw_diagram_page(page):
+    """Title, a flowchart, a filled chart with a label, a framed shape and a speck."""
+    page.insert_text((60, 60), "System Overview", fontsize=32)
+    # Three outlined boxes joined by arrows: one diagram
+    for x in (80, 260, 440):
+        page.draw_rect(fitz.Rect(x, 150, x + 120, 230), color=(0.1, 0.3, 0.8), width=3)
+    page.draw_line((200, 190), (260, 190), color=(0, 0, 0), width=2)
+    page.draw_line((380, 190), (440, 190), color=(0, 0, 0), width=2)
+    page.draw_rect(fitz.Rect(650, 300, 900, 480), color=None, fill=(0.9, 0.5, 0.1))
+    page.insert_text((700, 400), "Growth", fontsize=20)
+    # A shape inside a frame's hole is part of the frame's crop
+    page.draw_rect(fitz.Rect(80, 300, 400, 500), color=(0, 0, 0), width=2)
+    page.draw_circle(fitz.Point(240, 400), 40, color=None, fill=(0.2, 0.7, 0.3))
+    # Too small to be a diagram
+    page.draw_rect(fitz.Rect(500, 500, 505, 505), color=None, fill=(0, 0, 0))
@@ -0,0 +1,82 @@
+"""
+Unit tests for the direct (PDF text layer) extractor.
+
+Pages are built in memory with PyMuPDF, so no fixture files are needed.
+"""
+
+import fitz
+import pytest
+
+from notebooklm2ppt.direct_extractor import DirectSlideExtractor
+from tests.helpers import draw_diagram_page
+
+
+def _slide_pdf(tmp_path, draw):
+    """Save a one-page 16:9 PDF drawn by draw(page) and return its path."""
+    doc = fitz.open()
+    page = doc.new_page(width=960, height=540)
+    draw(page)
+    path = tmp_path / "slide.pdf"
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def _red_pixels(image):
+    """Number of strongly red pixels in a BGR image."""
+    b, g, r = (image[..., c].astype(int) for c in range(3))
+    return int(((r > 150) & (g < 100) & (b < 100)).sum())
+
+
+class TestCleanBackground:
+    """Tests that extracted objects are removed from the clean background."""
+
+    @pytest.mark.parametrize("rect", [
+        (480, 160, 900, 480),   # large diagram: mask above the fast-fill coverage
+        (700, 300, 760, 360),   # small shape: inpainted
+    ])
+    def test_masked_shape_is_removed(self, tmp_path, rect):
+        """A solid shape extracted as an image object must not remain in clean_image."""
+        def draw(page):
+            page.insert_text((60, 80), "Quarterly Review", fontsize=36)
+            page.draw_rect(fitz.Rect(*rect), color=None, fill=(0.9, 0.1, 0.1))
+
+        extractor = DirectSlideExtractor()
+        result = extractor.process_page(_slide_pdf(tmp_path, draw), 0, dpi=100)
+        extractor.close()
+
+        assert len(result["image_objects"]) == 1
+        assert _red_pixels(result["clean_image"]) == 0
+
+
+class TestHiddenTextLayer:
+    """Tests for PDFs with an invisible (render mode 3) OCR text layer."""
+
+    def test_visible_text_wins_over_hidden_duplicate(self, tmp_path):
+        """Where hidden and visible text overlap, only the visible span is kept."""
+        def draw(page):
+            # The OCR layer comes first in the content stream, as in scanned decks
+            page.insert_text((60, 80), "Quarterly Reveiw", fontsize=36, fontname="helv", render_mode=3)
+            page.insert_text((60, 80), "Quarterly Review", fontsize=36, fontname="tiro")
+            page.insert_text((60, 300), "Scanned only", fontsize=20, fontname="helv", render_mode=3)
+
+        extractor = DirectSlideExtractor()
+        result = extractor.process_page(_slide_pdf(tmp_path, draw), 0, dpi=100)
+        extractor.close()
+
+        blocks = [(b["text"], b["font"]) for b in result["text_blocks"]]
+        # Hidden text with no visible copy is still the page's only text there
+        assert blocks == [("Quarterly Review", "Times-Roman"), ("Scanned only", "Helvetica")]
+
+
+class TestImageObjects:
+    """Tests for diagram detection on the non-text ink."""
+
+    def test_diagram_boxes(self, tmp_path):
+        """Image objects keep the padded boxes the findContours version found."""
+        extractor = DirectSlideExtractor()
+        result = extractor.process_page(_slide_pdf(tmp_path, draw_diagram_page), 0, dpi=100)
+        extractor.close()
+
+        boxes = sorted(obj["box"] for obj in result["image_objects"])
+        assert boxes == [[95, 192, 699, 144], [95, 401, 476, 309], [888, 402, 376, 279]]